@@ -6,16 +6,58 @@ This script provides an interactive interface for the Rewards Redemption Optimiz
 with real Amadeus API integration for actual flight data and pricing.
 """
 
-import json
+import io
 import os
-from datetime import date, datetime
+import re
+from contextlib import contextmanager, redirect_stdout
+from datetime import date
+from itertools import islice
 from typing import Dict, Any
 import sys
 
-from redemption_optimizer.calculator import RedemptionCalculator, RedemptionOption
-from redemption_optimizer.route_optimizer import RouteOptimizer
-from redemption_optimizer.recommender import RedemptionRecommender, UserPreferences
-from redemption_optimizer.amadeus_client import AmadeusClient
+
+@contextmanager
+def buffered_output():
+    """
+    Collect every print() inside the block and emit one sys.stdout.write.
+
+    Each print normally acquires the stdout lock, encodes, and flushes;
+    buffering a whole screen into a single write cuts the syscall count
+    dramatically on remote ptys and CI log capture.
+    """
+    buffer = io.StringIO()
+    try:
+        with redirect_stdout(buffer):
+            yield
+    finally:
+        sys.stdout.write(buffer.getvalue())
+        sys.stdout.flush()
+
+# Heavy optimizer modules are imported lazily inside the functions that
+# need them so the CLI reaches its first prompt without paying their cost.
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1)
+def _get_components():
+    """
+    Build the shared optimizer components once per process.
+
+    Every demo section reuses the same AmadeusClient (one OAuth token
+    acquisition instead of one per section), calculator, route optimizer,
+    and recommender.
+    """
+    from redemption_optimizer.amadeus_client import AmadeusClient
+    from redemption_optimizer.calculator import RedemptionCalculator
+    from redemption_optimizer.recommender import RedemptionRecommender
+    from redemption_optimizer.route_optimizer import RouteOptimizer
+
+    amadeus_client = AmadeusClient()
+    calculator = RedemptionCalculator()
+    optimizer = RouteOptimizer(amadeus_client)
+    recommender = RedemptionRecommender(amadeus_client, calculator=calculator,
+                                        route_optimizer=optimizer)
+    return amadeus_client, calculator, optimizer, recommender
 
 
 def print_header(title: str, width: int = 80):
@@ -44,24 +86,19 @@ def format_miles(miles: int) -> str:
 
 def setup_amadeus_api():
     """Guide user through Amadeus API setup"""
+    # Credentials already configured — skip the banner and prompts entirely
+    if os.getenv('AMADEUS_API_KEY') and os.getenv('AMADEUS_API_SECRET'):
+        return None, None
+
     print_header("AMADEUS API SETUP")
     print("To get real flight data, you need an Amadeus API key.")
     print("1. Go to: https://developers.amadeus.com/")
     print("2. Sign up for a free account")
     print("3. Create a new application to get your API key and secret")
     print("4. Set environment variables or enter them below")
-    
-    use_env = input("\nDo you have AMADEUS_API_KEY and AMADEUS_API_SECRET environment variables set? (y/n): ").strip().lower()
-    
-    if use_env == 'y':
-        if os.getenv('AMADEUS_API_KEY') and os.getenv('AMADEUS_API_SECRET'):
-            print("✅ Environment variables found!")
-            return None, None
-        else:
-            print("❌ Environment variables not found. Please enter your credentials:")
-    
-    api_key = input("Enter your Amadeus API Key: ").strip()
-    api_secret = input("Enter your Amadeus API Secret: ").strip()
+
+    api_key = _read("\nEnter your Amadeus API Key: ").strip()
+    api_secret = _read("Enter your Amadeus API Secret: ").strip()
     
     if api_key and api_secret:
         return api_key, api_secret
@@ -70,30 +107,61 @@ def setup_amadeus_api():
         return None, None
 
 
+# Single-pass uppercase translation plus a precompiled IATA-code validator,
+# instead of chained .strip().upper() allocations per input
+_AIRPORT_TABLE = str.maketrans('abcdefghijklmnopqrstuvwxyz', 'ABCDEFGHIJKLMNOPQRSTUVWXYZ')
+_AIRPORT_CODE_RE = re.compile(r'^[A-Z]{3}$')
+
+
+def _parse_airport_code(raw: str) -> str:
+    """Normalize raw airport input; returns '' when not a 3-letter code."""
+    code = raw.translate(_AIRPORT_TABLE).strip()
+    return code if _AIRPORT_CODE_RE.match(code) else ''
+
+
+def _read(prompt: str, default: str = '') -> str:
+    """
+    Prompt and read one line from stdin.
+
+    Avoids input()'s readline-hook installation and per-call stdout
+    machinery, which adds up over the ~7 consecutive prompts in
+    get_user_input (and is pure overhead for piped/scripted invocation).
+    """
+    if sys.stdin.isatty():
+        # Keep input()'s line editing/history for real terminals
+        return input(prompt) or default
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    return line.rstrip('\n') or default
+
+
 def get_user_input():
+    from redemption_optimizer.recommender import UserPreferences
+
     print_header("INTERACTIVE REWARDS REDEMPTION OPTIMIZER")
     print("Enter your trip and points details below. Press Enter to use defaults in brackets.")
-    
-    origin = input("Origin airport code (e.g. JFK): ").strip().upper() or "JFK"
-    destination = input("Destination airport code (e.g. LAX): ").strip().upper() or "LAX"
-    date_str = input("Travel date (YYYY-MM-DD) [2024-06-15]: ").strip() or "2024-06-15"
+
+    origin = _parse_airport_code(_read("Origin airport code (e.g. JFK): ")) or "JFK"
+    destination = _parse_airport_code(_read("Destination airport code (e.g. LAX): ")) or "LAX"
+    date_str = _read("Travel date (YYYY-MM-DD) [2024-06-15]: ").strip() or "2024-06-15"
     try:
-        travel_date = datetime.strptime(date_str, "%Y-%m-%d").date()
-    except Exception:
+        travel_date = date.fromisoformat(date_str)
+    except ValueError:
         print("Invalid date format. Using default 2024-06-15.")
         travel_date = date(2024, 6, 15)
     
     try:
-        available_miles = int(input("Available miles/points [50000]: ").strip() or "50000")
+        available_miles = int(_read("Available miles/points [50000]: ").strip() or "50000")
     except Exception:
         print("Invalid number. Using default 50000.")
         available_miles = 50000
     
-    maximize_value = input("Maximize value? (y/n) [y]: ").strip().lower() or "y"
-    minimize_fees = input("Minimize fees? (y/n) [n]: ").strip().lower() or "n"
-    include_alternatives = input("Include alternative redemptions (gift cards, etc)? (y/n) [y]: ").strip().lower() or "y"
+    maximize_value = _read("Maximize value? (y/n) [y]: ").strip().lower() or "y"
+    minimize_fees = _read("Minimize fees? (y/n) [n]: ").strip().lower() or "n"
+    include_alternatives = _read("Include alternative redemptions (gift cards, etc)? (y/n) [y]: ").strip().lower() or "y"
     try:
-        min_value_per_mile = float(input("Minimum value per mile/point in cents [1.0]: ").strip() or "1.0")
+        min_value_per_mile = float(_read("Minimum value per mile/point in cents [1.0]: ").strip() or "1.0")
     except Exception:
         min_value_per_mile = 1.0
     
@@ -107,6 +175,9 @@ def get_user_input():
 
 
 def interactive_mode():
+    from redemption_optimizer.amadeus_client import AmadeusClient
+    from redemption_optimizer.recommender import RedemptionRecommender
+
     # Setup Amadeus API
     api_key, api_secret = setup_amadeus_api()
     
@@ -122,57 +193,82 @@ def interactive_mode():
         recommendations = recommender.generate_recommendations(
             origin, destination, travel_date, available_miles, preferences
         )
-        
-        print(f"\n📊 Results Summary:")
-        print(f"  • Total options found: {recommendations['summary']['total_options_found']}")
-        print(f"  • Affordable options: {recommendations['summary']['affordable_options']}")
-        print(f"  • Recommendations generated: {recommendations['summary']['recommendations_generated']}")
-        print(f"  • Average value: {recommendations['summary']['average_value_per_mile']:.2f}¢ per mile/point")
-        
-        if recommendations['recommendations']:
-            print("\n🏆 Top Recommendations:")
-            for i, rec in enumerate(recommendations['recommendations'], 1):
-                print(f"\n{i}. {rec['type'].title()} - {rec.get('subtype', rec.get('chain', rec.get('merchant', '')))}")
-                print(f"   Cost: {format_miles(rec.get('cost_miles', rec.get('cost_points', 0)))} miles/points")
-                print(f"   Cash Value: {format_currency(rec['cash_equivalent'])}")
-                print(f"   Fees: {format_currency(rec['fees'])}")
-                print(f"   Value: {rec.get('value_per_mile', rec.get('value_per_point', 0)):.2f}¢ per mile/point")
-                print(f"   Savings: {format_currency(rec['savings_vs_cash'])}")
-                
-                if rec['type'] == 'flight':
-                    print(f"   Route: {rec['route']}")
-                    print(f"   Duration: {rec['duration_hours']:.1f} hours")
-                    if rec.get('airline'):
-                        print(f"   Airline: {rec['airline']}")
-                elif rec['type'] == 'hotel':
-                    print(f"   Location: {rec['location']}")
-            
-            print("\n🎯 Best Overall Option:")
-            best = recommendations['best_overall']
-            if best:
-                print(f"{best['type'].title()} - {best.get('subtype', best.get('chain', best.get('merchant', '')))}")
-                print(f"Value: {best.get('value_per_mile', best.get('value_per_point', 0)):.2f}¢ per mile/point")
-                print(f"Savings: {format_currency(best['savings_vs_cash'])}")
-            else:
-                print("No best option found.")
-        else:
-            print("\n❌ No recommendations found. Try:")
-            print("  • Increasing your available miles")
-            print("  • Lowering your minimum value threshold")
-            print("  • Checking different dates")
-            print("  • Including alternative redemptions")
-            
+
+        with buffered_output():
+            print_results_screen(recommendations)
+
     except Exception as e:
         print(f"\n❌ Error generating recommendations: {e}")
         import traceback
         traceback.print_exc()
 
 
+def _subtype(rec: Dict[str, Any]) -> str:
+    """Resolve an option's display label without a chained .get cascade."""
+    return rec.get('subtype') or rec.get('chain') or rec.get('merchant') or ''
+
+
+def _value_per_unit(rec: Dict[str, Any]) -> float:
+    """Resolve an option's cents-per-mile/point value."""
+    value = rec.get('value_per_mile')
+    return value if value is not None else rec.get('value_per_point', 0)
+
+
+MAX_DISPLAYED_RECOMMENDATIONS = 5
+
+
+def print_results_screen(recommendations: Dict[str, Any]):
+    """Render the interactive-mode results screen."""
+    print(f"\n📊 Results Summary:")
+    print(f"  • Total options found: {recommendations['summary']['total_options_found']}")
+    print(f"  • Affordable options: {recommendations['summary']['affordable_options']}")
+    print(f"  • Recommendations generated: {recommendations['summary']['recommendations_generated']}")
+    print(f"  • Average value: {recommendations['summary']['average_value_per_mile']:.2f}¢ per mile/point")
+
+    if recommendations['recommendations']:
+        print("\n🏆 Top Recommendations:")
+        top_recs = islice(recommendations['recommendations'], MAX_DISPLAYED_RECOMMENDATIONS)
+        for i, rec in enumerate(top_recs, 1):
+            # Build the whole entry as one string, emitted with one print
+            entry = (
+                f"\n{i}. {rec['type'].title()} - {_subtype(rec)}\n"
+                f"   Cost: {format_miles(rec.get('cost_miles', rec.get('cost_points', 0)))} miles/points\n"
+                f"   Cash Value: {format_currency(rec['cash_equivalent'])}\n"
+                f"   Fees: {format_currency(rec['fees'])}\n"
+                f"   Value: {_value_per_unit(rec):.2f}¢ per mile/point\n"
+                f"   Savings: {format_currency(rec['savings_vs_cash'])}"
+            )
+            if rec['type'] == 'flight':
+                entry += f"\n   Route: {rec['route']}\n   Duration: {rec['duration_hours']:.1f} hours"
+                if rec.get('airline'):
+                    entry += f"\n   Airline: {rec['airline']}"
+            elif rec['type'] == 'hotel':
+                entry += f"\n   Location: {rec['location']}"
+            print(entry)
+
+        print("\n🎯 Best Overall Option:")
+        best = recommendations['best_overall']
+        if best:
+            print(f"{best['type'].title()} - {_subtype(best)}")
+            print(f"Value: {_value_per_unit(best):.2f}¢ per mile/point")
+            print(f"Savings: {format_currency(best['savings_vs_cash'])}")
+        else:
+            print("No best option found.")
+    else:
+        print("\n❌ No recommendations found. Try:")
+        print("  • Increasing your available miles")
+        print("  • Lowering your minimum value threshold")
+        print("  • Checking different dates")
+        print("  • Including alternative redemptions")
+
+
 def demo_part_1_value_calculator():
     """Demonstrate Part 1: Value Calculator"""
+    from redemption_optimizer.calculator import RedemptionOption
+
     print_header("PART 1: VALUE CALCULATOR")
-    
-    calculator = RedemptionCalculator()
+
+    _, calculator, _, _ = _get_components()
     
     # Demo 1: Sample data analysis from requirements
     print_subheader("Sample Data Analysis (from requirements)")
@@ -186,9 +282,9 @@ def demo_part_1_value_calculator():
     for comparison in sample_analysis['sample_analysis']:
         option = comparison['option']
         calc = comparison['calculation']
-        rating = calculator.get_value_rating(calc.get('value_per_mile', calc.get('value_per_point', 0)))
+        rating = calculator.get_value_rating(_value_per_unit(calc))
         
-        value = calc.get('value_per_mile', calc.get('value_per_point', 0))
+        value = _value_per_unit(calc)
         print(f"{option.name:<25} {format_miles(option.miles_cost):<15} "
               f"{format_currency(option.cash_equivalent):<15} "
               f"{format_currency(option.taxes_fees):<10} "
@@ -233,21 +329,21 @@ def demo_part_1_value_calculator():
     for i, comparison in enumerate(comparisons, 1):
         option = comparison['option']
         calc = comparison['calculation']
-        rating = calculator.get_value_rating(calc.get('value_per_mile', calc.get('value_per_point', 0)))
+        rating = calculator.get_value_rating(_value_per_unit(calc))
         
         print(f"\n{i}. {option.name}")
         print(f"   Cost: {format_miles(option.miles_cost)} miles/points")
         print(f"   Cash Value: {format_currency(option.cash_equivalent)}")
         print(f"   Fees: {format_currency(option.taxes_fees)}")
-        print(f"   Value: {calc.get('value_per_mile', calc.get('value_per_point', 0)):.2f}¢ per mile/point ({rating})")
+        print(f"   Value: {_value_per_unit(calc):.2f}¢ per mile/point ({rating})")
         print(f"   Savings: {format_currency(calc['savings_vs_cash'])}")
 
 
 def demo_part_2_route_optimizer():
     """Demonstrate Part 2: Route Optimizer"""
     print_header("PART 2: ROUTE OPTIMIZER")
-    
-    optimizer = RouteOptimizer()
+
+    _, _, optimizer, _ = _get_components()
     
     # Demo 1: NYC to LAX trip
     print_subheader("NYC to LAX Trip Analysis")
@@ -257,9 +353,9 @@ def demo_part_2_route_optimizer():
     travel_date = date(2024, 6, 15)
     
     print(f"Searching for routes from {origin} to {destination} on {travel_date}")
-    
-    # Find direct routes
-    direct_routes = optimizer.find_direct_routes(origin, destination, travel_date)
+
+    # Find direct and layover routes concurrently
+    direct_routes, layover_routes = optimizer.find_all_routes_parallel(origin, destination, travel_date)
     print(f"\nDirect routes found: {len(direct_routes)}")
     
     for route in direct_routes:
@@ -269,8 +365,6 @@ def demo_part_2_route_optimizer():
         print(f"    Total Cost: {format_currency(route.total_cost)}")
         print(f"    Duration: {route.duration_hours:.1f} hours")
     
-    # Find layover routes
-    layover_routes = optimizer.find_layover_routes(origin, destination, travel_date)
     print(f"\nLayover routes found: {len(layover_routes)}")
     
     for route in layover_routes:
@@ -283,7 +377,10 @@ def demo_part_2_route_optimizer():
     # Demo 2: Optimal routes analysis
     print_subheader("Optimal Routes Analysis")
     
-    optimal_results = optimizer.find_optimal_routes(origin, destination, travel_date)
+    optimal_results = optimizer.find_optimal_routes(
+        origin, destination, travel_date,
+        direct_routes=direct_routes, layover_routes=layover_routes
+    )
     
     print(f"Total routes found: {optimal_results['total_routes_found']}")
     print(f"Direct routes: {optimal_results['direct_routes_count']}")
@@ -313,9 +410,11 @@ def demo_part_2_route_optimizer():
 
 def demo_part_3_recommendation_engine():
     """Demonstrate Part 3: Recommendation Engine"""
+    from redemption_optimizer.recommender import UserPreferences
+
     print_header("PART 3: RECOMMENDATION ENGINE")
-    
-    recommender = RedemptionRecommender()
+
+    _, _, _, recommender = _get_components()
     
     # Demo 1: NYC to LAX with 50,000 miles
     print_subheader("NYC to LAX Trip with 50,000 Miles")
@@ -351,11 +450,11 @@ def demo_part_3_recommendation_engine():
     
     print("\nTop Recommendations:")
     for i, rec in enumerate(recommendations['recommendations'], 1):
-        print(f"\n{i}. {rec['type'].title()} - {rec.get('subtype', rec.get('chain', rec.get('merchant', '')))}")
+        print(f"\n{i}. {rec['type'].title()} - {_subtype(rec)}")
         print(f"   Cost: {format_miles(rec.get('cost_miles', rec.get('cost_points', 0)))} miles/points")
         print(f"   Cash Value: {format_currency(rec['cash_equivalent'])}")
         print(f"   Fees: {format_currency(rec['fees'])}")
-        print(f"   Value: {rec.get('value_per_mile', rec.get('value_per_point', 0)):.2f}¢ per mile/point")
+        print(f"   Value: {_value_per_unit(rec):.2f}¢ per mile/point")
         print(f"   Savings: {format_currency(rec['savings_vs_cash'])}")
         
         if rec['type'] == 'flight':
@@ -396,12 +495,12 @@ def demo_part_3_recommendation_engine():
 
 def demo_integration():
     """Demonstrate integration between all three parts"""
+    from redemption_optimizer.recommender import UserPreferences
+
     print_header("INTEGRATION DEMO: COMPLETE WORKFLOW")
-    
-    # Create instances of all components
-    calculator = RedemptionCalculator()
-    optimizer = RouteOptimizer()
-    recommender = RedemptionRecommender()
+
+    # Reuse the shared component instances
+    _, calculator, optimizer, recommender = _get_components()
     
     # Scenario: User wants to optimize their 75,000 miles for a trip
     print_subheader("Complete Optimization Workflow")
@@ -443,7 +542,7 @@ def demo_integration():
     if recommendations['best_overall']:
         best = recommendations['best_overall']
         print(f"\n🏆 BEST OVERALL: {best['type'].title()}")
-        print(f"   Value: {best.get('value_per_mile', best.get('value_per_point', 0)):.2f}¢ per mile/point")
+        print(f"   Value: {_value_per_unit(best):.2f}¢ per mile/point")
         print(f"   Savings: {format_currency(best['savings_vs_cash'])}")
         
         if best['type'] == 'flight':
@@ -454,7 +553,7 @@ def demo_integration():
     if recommendations['best_value_per_mile']:
         best_value = recommendations['best_value_per_mile']
         print(f"\n💎 BEST VALUE PER MILE: {best_value['type'].title()}")
-        print(f"   Value: {best_value.get('value_per_mile', best_value.get('value_per_point', 0)):.2f}¢ per mile/point")
+        print(f"   Value: {_value_per_unit(best_value):.2f}¢ per mile/point")
         print(f"   Savings: {format_currency(best_value['savings_vs_cash'])}")
 
 
@@ -465,14 +564,19 @@ def main():
     print("1. Interactive mode (recommended) - Enter your own trip details")
     print("2. Demo mode - See scripted examples")
     
-    mode = input("\nMode [interactive/demo]: ").strip().lower()
+    mode = _read("\nMode [interactive/demo]: ").strip().lower()
     
     if mode == "demo":
         try:
-            demo_part_1_value_calculator()
-            demo_part_2_route_optimizer()
-            demo_part_3_recommendation_engine()
-            demo_integration()
+            # Each demo section renders one screen; buffer it into a single write
+            with buffered_output():
+                demo_part_1_value_calculator()
+            with buffered_output():
+                demo_part_2_route_optimizer()
+            with buffered_output():
+                demo_part_3_recommendation_engine()
+            with buffered_output():
+                demo_integration()
             print_header("DEMO COMPLETE")
             print("\n✅ All three parts of the Rewards Redemption Optimizer are working!")
             print("\nKey Features Demonstrated:")
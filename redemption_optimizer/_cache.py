@@ -0,0 +1,129 @@
+"""
+TTL Caches
+
+Small thread-safe in-memory cache plus an on-disk layer, used to avoid
+re-paying Amadeus API latency for repeated queries (same
+origin/destination/date) within a TTL window. The disk layer persists
+across processes, so restarting the CLI still hits warm entries.
+"""
+
+import hashlib
+import os
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from . import _json
+
+# Cache store: key -> (expires_at_monotonic, value)
+_store: Dict[str, Tuple[float, Any]] = {}
+_lock = threading.Lock()
+
+
+def cache_key(name: str, params: Dict[str, Any]) -> str:
+    """
+    Build a stable cache key from an endpoint name and its parameters.
+
+    Args:
+        name: Logical endpoint name (e.g. 'amadeus_flights')
+        params: Dictionary of normalized request parameters
+
+    Returns:
+        String key usable with cache_get/cache_set
+    """
+    parts = [f"{key}={params[key]}" for key in sorted(params)]
+    return f"{name}|{'|'.join(parts)}"
+
+
+def cache_get(key: str) -> Optional[Any]:
+    """
+    Get a cached value if present and not expired.
+
+    Args:
+        key: Cache key from cache_key()
+
+    Returns:
+        Cached value, or None on miss/expiry
+    """
+    with _lock:
+        entry = _store.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del _store[key]
+            return None
+        return value
+
+
+def cache_set(key: str, value: Any, ttl_ms: int) -> None:
+    """
+    Store a value in the cache with a time-to-live.
+
+    Args:
+        key: Cache key from cache_key()
+        value: Value to cache
+        ttl_ms: Time-to-live in milliseconds
+    """
+    with _lock:
+        _store[key] = (time.monotonic() + ttl_ms / 1000.0, value)
+
+
+def cache_clear() -> None:
+    """Clear all cached entries (mainly useful for testing)."""
+    with _lock:
+        _store.clear()
+
+
+# On-disk cache directory (one JSON file per entry, named by key digest)
+DISK_CACHE_DIR = os.path.expanduser(os.path.join('~', '.cache', 'rove_amadeus'))
+
+
+def _disk_path(key: str) -> str:
+    """Map a cache key to its on-disk file path."""
+    digest = hashlib.sha1(key.encode()).hexdigest()
+    return os.path.join(DISK_CACHE_DIR, f"{digest}.json")
+
+
+def disk_cache_get(key: str) -> Optional[Any]:
+    """
+    Get a value from the on-disk cache if present and not expired.
+
+    Args:
+        key: Cache key from cache_key()
+
+    Returns:
+        Cached (JSON-decoded) value, or None on miss/expiry/corruption
+    """
+    path = _disk_path(key)
+    try:
+        with open(path, 'rb') as handle:
+            entry = _json.loads(handle.read())
+        if time.time() >= entry['expires_at']:
+            os.remove(path)
+            return None
+        return entry['value']
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def disk_cache_set(key: str, value: Any, ttl_ms: int) -> None:
+    """
+    Store a JSON-serializable value in the on-disk cache.
+
+    Args:
+        key: Cache key from cache_key()
+        value: JSON-serializable value to cache
+        ttl_ms: Time-to-live in milliseconds
+    """
+    path = _disk_path(key)
+    entry = {'expires_at': time.time() + ttl_ms / 1000.0, 'value': value}
+    try:
+        os.makedirs(DISK_CACHE_DIR, exist_ok=True)
+        # Write then rename so concurrent readers never see a partial file
+        tmp_path = f"{path}.tmp.{os.getpid()}"
+        with open(tmp_path, 'w') as handle:
+            handle.write(_json.dumps(entry))
+        os.replace(tmp_path, path)
+    except OSError:
+        pass  # Disk cache is best-effort; a failed write just means a miss later
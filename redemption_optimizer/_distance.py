@@ -0,0 +1,93 @@
+"""
+Airport Distances
+
+Shared distance lookup for the optimizer: hand-checked route overrides
+first, then a great-circle (haversine) computation over known airport
+coordinates, so unknown pairs get a real estimate instead of the old
+constant-1000 fallback.
+"""
+
+from functools import lru_cache
+from math import asin, cos, radians, sin, sqrt
+from typing import Dict, Tuple
+
+EARTH_RADIUS_MILES = 3958.8
+
+# Hand-checked route distances (checked in both directions)
+ROUTE_OVERRIDES: Dict[Tuple[str, str], int] = {
+    ('JFK', 'LAX'): 2475,
+    ('JFK', 'ORD'): 740,
+    ('JFK', 'ATL'): 760,
+    ('JFK', 'DFW'): 1389,
+    ('LAX', 'ORD'): 1744,
+    ('LAX', 'ATL'): 1947,
+    ('LAX', 'DFW'): 1235,
+    ('ORD', 'ATL'): 606,
+    ('ORD', 'DFW'): 802,
+    ('ATL', 'DFW'): 731,
+}
+
+# Approximate (latitude, longitude) for the hub airports this tool knows
+AIRPORT_COORDS: Dict[str, Tuple[float, float]] = {
+    'ATL': (33.64, -84.43),
+    'DFW': (32.90, -97.04),
+    'ORD': (41.97, -87.91),
+    'LAX': (33.94, -118.41),
+    'JFK': (40.64, -73.78),
+    'LHR': (51.47, -0.45),
+    'CDG': (49.01, 2.55),
+    'NRT': (35.77, 140.39),
+    'HKG': (22.31, 113.91),
+    'SIN': (1.36, 103.99),
+    'DEN': (39.86, -104.67),
+    'MIA': (25.79, -80.29),
+    'SEA': (47.45, -122.31),
+    'SFO': (37.62, -122.38),
+    'BOS': (42.36, -71.01),
+    'IAH': (29.99, -95.34),
+    'MSP': (44.88, -93.22),
+    'DTW': (42.21, -83.35),
+    'PHX': (33.43, -112.01),
+    'LAS': (36.08, -115.15),
+}
+
+# Last resort when neither airport has known coordinates
+DEFAULT_DISTANCE_MILES = 1000
+
+# Overrides symmetrized once at import: one hash lookup per query, no
+# reverse-tuple branch
+_SYMMETRIC_OVERRIDES: Dict[Tuple[str, str], int] = {}
+for _route, _miles in ROUTE_OVERRIDES.items():
+    _SYMMETRIC_OVERRIDES[_route] = _miles
+    _SYMMETRIC_OVERRIDES[(_route[1], _route[0])] = _miles
+
+
+def _haversine_miles(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance in miles between two coordinate pairs."""
+    lat1, lon1, lat2, lon2 = map(radians, (lat1, lon1, lat2, lon2))
+    h = sin((lat2 - lat1) / 2) ** 2 + cos(lat1) * cos(lat2) * sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_MILES * asin(sqrt(h))
+
+
+@lru_cache(maxsize=1024)
+def distance_between(origin: str, destination: str) -> int:
+    """
+    Approximate distance in miles between two airports.
+
+    Args:
+        origin: Origin airport code
+        destination: Destination airport code
+
+    Returns:
+        Distance in miles (override table, haversine, or default)
+    """
+    override = _SYMMETRIC_OVERRIDES.get((origin, destination))
+    if override is not None:
+        return override
+
+    origin_coords = AIRPORT_COORDS.get(origin)
+    destination_coords = AIRPORT_COORDS.get(destination)
+    if origin_coords and destination_coords:
+        return round(_haversine_miles(*origin_coords, *destination_coords))
+
+    return DEFAULT_DISTANCE_MILES
@@ -0,0 +1,29 @@
+"""
+JSON Helpers
+
+Thin wrappers that prefer orjson (2-4x faster parse, less garbage) and
+fall back to the stdlib json module when orjson is not installed.
+"""
+
+from typing import Any, Union
+
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+import json as _stdlib_json
+
+
+def loads(payload: Union[str, bytes]) -> Any:
+    """Parse a JSON string or bytes payload."""
+    if _orjson is not None:
+        return _orjson.loads(payload)
+    return _stdlib_json.loads(payload)
+
+
+def dumps(obj: Any) -> str:
+    """Serialize an object to a JSON string."""
+    if _orjson is not None:
+        return _orjson.dumps(obj).decode()
+    return _stdlib_json.dumps(obj)
@@ -5,20 +5,34 @@ This module provides real flight data integration using the Amadeus API
 for actual flight searches, pricing, and availability.
 """
 
+import asyncio
+import logging
 import os
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import date, datetime, timedelta
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict, field
 
-try:
-    from amadeus import Client, ResponseError
-except ImportError:
-    print("Warning: Amadeus SDK not installed. Install with: pip install amadeus")
-    Client = None
-    ResponseError = Exception
+from ._cache import cache_get, cache_key, cache_set, disk_cache_get, disk_cache_set
+from ._distance import distance_between
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+# TTL windows for cached API responses (milliseconds)
+FLIGHT_CACHE_TTL_MS = 10 * 60 * 1000   # 10 minutes
+HOTEL_CACHE_TTL_MS = 10 * 60 * 1000    # 10 minutes
+AIRPORT_CACHE_TTL_MS = 60 * 60 * 1000  # 1 hour (airport info rarely changes)
+
+# On-disk TTLs are longer: entries survive process restarts and the
+# fare-validity window comfortably exceeds an interactive session
+FLIGHT_DISK_TTL_MS = 60 * 60 * 1000        # 1 hour
+AIRPORT_DISK_TTL_MS = 24 * 60 * 60 * 1000  # 24 hours
+
+# Concurrency cap for batched flight searches
+MAX_SEARCH_WORKERS = 16
+
+
+@dataclass(slots=True)
 class FlightOffer:
     """Data class for flight offers from Amadeus API"""
     id: str
@@ -33,11 +47,39 @@ class FlightOffer:
     duration: str = ""
     stops: int = 0
     cabin_class: str = "ECONOMY"
-    segments: List[Dict[str, Any]] = None
-    
-    def __post_init__(self):
-        if self.segments is None:
-            self.segments = []
+    segments: List[Dict[str, Any]] = field(default_factory=list)
+
+
+# Specialized extractor for the flight-offer shape, compiled once at import.
+# Generating the straight-line source and exec'ing it keeps the per-offer
+# field paths inlined as plain locals with no per-call setup, and keeps the
+# single source of truth for the shape in one string.
+_EXTRACT_OFFER_SRC = """\
+def _extract_offer(offer):
+    itineraries = offer['itineraries']
+    outbound = itineraries[0]
+    segments = outbound['segments']
+    first_segment = segments[0]
+    price = offer['price']
+    flight_offer = FlightOffer(
+        id=offer.get('id', ''),
+        origin=first_segment['departure']['iataCode'],
+        destination=segments[-1]['arrival']['iataCode'],
+        departure_date=first_segment['departure']['at'][:10],
+        price=float(price['total']),
+        currency=price['currency'],
+        airline=first_segment['carrierCode'],
+        flight_number=first_segment['number'],
+        duration=outbound['duration'],
+        stops=len(segments) - 1,
+        cabin_class=offer['travelerPricings'][0]['fareDetailsBySegment'][0]['cabin'],
+        segments=segments
+    )
+    if len(itineraries) > 1:
+        flight_offer.return_date = itineraries[1]['segments'][0]['departure']['at'][:10]
+    return flight_offer
+"""
+exec(compile(_EXTRACT_OFFER_SRC, '<flight-offer-extractor>', 'exec'))
 
 
 class AmadeusClient:
@@ -58,22 +100,33 @@ class AmadeusClient:
         """
         self.api_key = api_key or os.getenv('AMADEUS_API_KEY')
         self.api_secret = api_secret or os.getenv('AMADEUS_API_SECRET')
-        
+        self.client = None
+        self._response_error: type = Exception
+
         if not self.api_key or not self.api_secret:
-            print("Warning: Amadeus API credentials not found.")
-            print("Set AMADEUS_API_KEY and AMADEUS_API_SECRET environment variables")
-            print("Or get free API key from: https://developers.amadeus.com/")
+            logger.warning("Amadeus API credentials not found; set AMADEUS_API_KEY "
+                           "and AMADEUS_API_SECRET (free key: "
+                           "https://developers.amadeus.com/)")
+            return
+
+        # Import the SDK lazily: mock-only and calculator-only callers never
+        # pay for the SDK's transitive imports at package-import time
+        try:
+            from amadeus import Client, ResponseError
+        except ImportError:
+            logger.warning("Amadeus SDK not installed. Install with: pip install amadeus")
+            return
+
+        try:
+            self.client = Client(
+                client_id=self.api_key,
+                client_secret=self.api_secret
+            )
+            self._response_error = ResponseError
+            logger.info("Amadeus API client initialized successfully")
+        except Exception as e:
+            logger.warning("Failed to initialize Amadeus client: %s", e)
             self.client = None
-        else:
-            try:
-                self.client = Client(
-                    client_id=self.api_key,
-                    client_secret=self.api_secret
-                )
-                print("✅ Amadeus API client initialized successfully")
-            except Exception as e:
-                print(f"❌ Failed to initialize Amadeus client: {e}")
-                self.client = None
     
     def is_available(self) -> bool:
         """Check if Amadeus API is available and configured."""
@@ -84,7 +137,12 @@ class AmadeusClient:
                       adults: int = 1, max_offers: int = 10) -> List[FlightOffer]:
         """
         Search for available flights using Amadeus API.
-        
+
+        Results are served from the process-wide TTL cache (and the on-disk
+        layer) when the same (origin, destination, date, adults, max_offers)
+        query repeats within the TTL window, so route-optimizer passes that
+        revisit a leg never pay a second network round-trip.
+
         Args:
             origin: Origin airport code
             destination: Destination airport code
@@ -96,14 +154,38 @@ class AmadeusClient:
         Returns:
             List of FlightOffer objects
         """
+        # Normalize inputs so equivalent queries share a cache entry
+        origin = origin.upper().strip()
+        destination = destination.upper().strip()
+
         if not self.is_available():
             return self._get_mock_flights(origin, destination, departure_date, return_date)
-        
+
         try:
             # Format dates for API
-            departure_str = departure_date.strftime('%Y-%m-%d')
-            return_str = return_date.strftime('%Y-%m-%d') if return_date else None
-            
+            departure_str = departure_date.isoformat()
+            return_str = return_date.isoformat() if return_date else None
+
+            # Check the TTL cache before hitting the API
+            key = cache_key("amadeus_flights", {
+                'origin': origin,
+                'destination': destination,
+                'departure_date': departure_str,
+                'return_date': return_str,
+                'adults': adults,
+                'max_offers': max_offers
+            })
+            cached = cache_get(key)
+            if cached is not None:
+                return cached
+
+            # Fall back to the on-disk cache (survives process restarts)
+            disk_value = disk_cache_get(key)
+            if disk_value is not None:
+                offers = [FlightOffer(**offer_dict) for offer_dict in disk_value]
+                cache_set(key, offers, FLIGHT_CACHE_TTL_MS)
+                return offers
+
             # Search for flight offers
             response = self.client.shopping.flight_offers_search.get(
                 originLocationCode=origin,
@@ -114,46 +196,74 @@ class AmadeusClient:
                 max=max_offers,
                 currencyCode="USD"
             )
-            
-            return self._parse_flight_offers(response.data)
-            
-        except ResponseError as e:
-            print(f"Amadeus API error: {e}")
+
+            offers = self._parse_flight_offers(response.data)
+            cache_set(key, offers, FLIGHT_CACHE_TTL_MS)
+            disk_cache_set(key, [asdict(offer) for offer in offers], FLIGHT_DISK_TTL_MS)
+            return offers
+
+        except self._response_error as e:
+            logger.warning("Amadeus API error: %s", e)
             return self._get_mock_flights(origin, destination, departure_date, return_date)
         except Exception as e:
-            print(f"Error searching flights: {e}")
+            logger.warning("Error searching flights: %s", e)
             return self._get_mock_flights(origin, destination, departure_date, return_date)
     
+    async def search_flights_async(self, origin: str, destination: str,
+                                   departure_date: date, return_date: Optional[date] = None,
+                                   adults: int = 1, max_offers: int = 10) -> List[FlightOffer]:
+        """
+        Async entry point for search_flights.
+
+        Runs the blocking SDK call in a worker thread via asyncio.to_thread
+        so event-loop callers can fan out legs with asyncio.gather without
+        stalling the loop; caching and mock fallbacks are identical to the
+        sync path.
+        """
+        return await asyncio.to_thread(self.search_flights, origin, destination,
+                                       departure_date, return_date=return_date,
+                                       adults=adults, max_offers=max_offers)
+
+    def search_flights_many(self, queries: List[Tuple[str, str, date]],
+                            adults: int = 1, max_offers: int = 10) -> List[List[FlightOffer]]:
+        """
+        Run many flight searches concurrently.
+
+        Each (origin, destination, departure_date) query is an independent
+        network round-trip, so fanning them out over a bounded thread pool
+        overlaps the latency instead of paying N x RTT; the underlying SDK
+        session reuses its HTTP connection and OAuth token across calls, and
+        the TTL cache still answers repeat queries without any I/O.
+
+        Args:
+            queries: List of (origin, destination, departure_date) tuples
+            adults: Number of adult passengers
+            max_offers: Maximum number of offers per query
+
+        Returns:
+            List of offer lists, in the same order as the queries
+        """
+        if not queries:
+            return []
+
+        workers = min(MAX_SEARCH_WORKERS, len(queries))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self.search_flights, origin, destination,
+                                departure_date, adults=adults, max_offers=max_offers)
+                for origin, destination, departure_date in queries
+            ]
+            return [future.result() for future in futures]
+
     def _parse_flight_offers(self, offers_data: List[Dict[str, Any]]) -> List[FlightOffer]:
         """Parse Amadeus API response into FlightOffer objects."""
         offers = []
         
         for offer in offers_data:
             try:
-                # Extract basic info
-                flight_offer = FlightOffer(
-                    id=offer.get('id', ''),
-                    origin=offer['itineraries'][0]['segments'][0]['departure']['iataCode'],
-                    destination=offer['itineraries'][0]['segments'][-1]['arrival']['iataCode'],
-                    departure_date=offer['itineraries'][0]['segments'][0]['departure']['at'][:10],
-                    price=float(offer['price']['total']),
-                    currency=offer['price']['currency'],
-                    airline=offer['itineraries'][0]['segments'][0]['carrierCode'],
-                    flight_number=offer['itineraries'][0]['segments'][0]['number'],
-                    duration=offer['itineraries'][0]['duration'],
-                    stops=len(offer['itineraries'][0]['segments']) - 1,
-                    cabin_class=offer['travelerPricings'][0]['fareDetailsBySegment'][0]['cabin'],
-                    segments=offer['itineraries'][0]['segments']
-                )
-                
-                # Add return date if exists
-                if len(offer['itineraries']) > 1:
-                    flight_offer.return_date = offer['itineraries'][1]['segments'][0]['departure']['at'][:10]
-                
-                offers.append(flight_offer)
-                
+                offers.append(_extract_offer(offer))
             except (KeyError, IndexError) as e:
-                print(f"Error parsing flight offer: {e}")
+                logger.debug("Error parsing flight offer: %s", e)
                 continue
         
         return offers
@@ -161,19 +271,23 @@ class AmadeusClient:
     def _get_mock_flights(self, origin: str, destination: str, 
                          departure_date: date, return_date: Optional[date] = None) -> List[FlightOffer]:
         """Generate mock flight data when API is not available."""
-        print("Using mock flight data (Amadeus API not available)")
+        logger.info("Using mock flight data (Amadeus API not available)")
         
         # Calculate distance for realistic pricing
         distance = self._calculate_distance(origin, destination)
         base_price = distance * 0.15  # Rough estimate: $0.15 per mile
+
+        # Format the dates once for both mock offers
+        departure_str = departure_date.isoformat()
+        return_str = return_date.isoformat() if return_date else None
         
         mock_offers = [
             FlightOffer(
                 id="mock_1",
                 origin=origin,
                 destination=destination,
-                departure_date=departure_date.strftime('%Y-%m-%d'),
-                return_date=return_date.strftime('%Y-%m-%d') if return_date else None,
+                departure_date=departure_str,
+                return_date=return_str,
                 price=base_price * 0.8,  # Economy
                 currency="USD",
                 airline="AA",
@@ -192,8 +306,8 @@ class AmadeusClient:
                 id="mock_2",
                 origin=origin,
                 destination=destination,
-                departure_date=departure_date.strftime('%Y-%m-%d'),
-                return_date=return_date.strftime('%Y-%m-%d') if return_date else None,
+                departure_date=departure_str,
+                return_date=return_str,
                 price=base_price * 1.5,  # Premium economy
                 currency="USD",
                 airline="DL",
@@ -222,29 +336,7 @@ class AmadeusClient:
     
     def _calculate_distance(self, origin: str, destination: str) -> int:
         """Calculate approximate distance between airports."""
-        # Simplified distance calculation
-        distances = {
-            ('JFK', 'LAX'): 2475,
-            ('JFK', 'ORD'): 740,
-            ('JFK', 'ATL'): 760,
-            ('JFK', 'DFW'): 1389,
-            ('LAX', 'ORD'): 1744,
-            ('LAX', 'ATL'): 1947,
-            ('LAX', 'DFW'): 1235,
-            ('ORD', 'ATL'): 606,
-            ('ORD', 'DFW'): 802,
-            ('ATL', 'DFW'): 731,
-        }
-        
-        route = (origin, destination)
-        reverse_route = (destination, origin)
-        
-        if route in distances:
-            return distances[route]
-        elif reverse_route in distances:
-            return distances[reverse_route]
-        else:
-            return 1000  # Default distance
+        return distance_between(origin, destination)
     
     def get_airport_info(self, airport_code: str) -> Dict[str, Any]:
         """
@@ -256,29 +348,44 @@ class AmadeusClient:
         Returns:
             Dictionary with airport information
         """
+        airport_code = airport_code.upper().strip()
+
         if not self.is_available():
             return {
                 'name': f'Airport {airport_code}',
                 'city': 'Unknown',
                 'country': 'Unknown'
             }
-        
+
         try:
+            key = cache_key("amadeus_airport", {'airport_code': airport_code})
+            cached = cache_get(key)
+            if cached is not None:
+                return cached
+
+            disk_value = disk_cache_get(key)
+            if disk_value is not None:
+                cache_set(key, disk_value, AIRPORT_CACHE_TTL_MS)
+                return disk_value
+
             response = self.client.reference_data.locations.get(
                 keyword=airport_code,
                 subType="AIRPORT"
             )
-            
+
             if response.data:
                 airport = response.data[0]
-                return {
+                info = {
                     'name': airport.get('name', ''),
                     'city': airport.get('address', {}).get('cityName', ''),
                     'country': airport.get('address', {}).get('countryName', '')
                 }
-            
+                cache_set(key, info, AIRPORT_CACHE_TTL_MS)
+                disk_cache_set(key, info, AIRPORT_DISK_TTL_MS)
+                return info
+
         except Exception as e:
-            print(f"Error getting airport info: {e}")
+            logger.warning("Error getting airport info: %s", e)
         
         return {
             'name': f'Airport {airport_code}',
@@ -300,22 +407,38 @@ class AmadeusClient:
         Returns:
             List of hotel offers
         """
+        city_code = city_code.upper().strip()
+
         if not self.is_available():
             return self._get_mock_hotels(city_code, check_in, check_out)
-        
+
         try:
+            check_in_str = check_in.isoformat()
+            check_out_str = check_out.isoformat()
+
+            key = cache_key("amadeus_hotels", {
+                'city_code': city_code,
+                'check_in': check_in_str,
+                'check_out': check_out_str,
+                'adults': adults
+            })
+            cached = cache_get(key)
+            if cached is not None:
+                return cached
+
             response = self.client.shopping.hotel_offers.get(
                 cityCode=city_code,
-                checkInDate=check_in.strftime('%Y-%m-%d'),
-                checkOutDate=check_out.strftime('%Y-%m-%d'),
+                checkInDate=check_in_str,
+                checkOutDate=check_out_str,
                 adults=adults,
                 currency="USD"
             )
-            
+
+            cache_set(key, response.data, HOTEL_CACHE_TTL_MS)
             return response.data
-            
+
         except Exception as e:
-            print(f"Error searching hotels: {e}")
+            logger.warning("Error searching hotels: %s", e)
             return self._get_mock_hotels(city_code, check_in, check_out)
     
     def _get_mock_hotels(self, city_code: str, check_in: date, check_out: date) -> List[Dict[str, Any]]:
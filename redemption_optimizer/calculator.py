@@ -5,11 +5,55 @@ Core functionality to calculate the value of different redemption options
 and compare them to find the best value-per-mile/point.
 """
 
-from typing import List, Dict, Any
+import heapq
+from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
+from functools import lru_cache
 
 
-@dataclass
+def _score(miles_cost: int, cash: float, taxes_fees: float,
+           threshold: float) -> Tuple[float, float, bool]:
+    """
+    Scalar scoring kernel: (net_value, value_per_unit, is_good_value).
+
+    All value math funnels through this one straight-line function — a JIT
+    (numba et al.) could compile it wholesale if the project ever grows a
+    native numeric stack.
+    """
+    net = cash - taxes_fees
+    value_per_unit = (net / miles_cost) * 100.0 if miles_cost > 0 else 0.0
+    return net, value_per_unit, value_per_unit >= threshold
+
+
+def _batch_values(miles_costs: List[int], cash_values: List[float],
+                  fees: List[float], threshold: float) -> List[Tuple[float, float, bool]]:
+    """
+    Compute (net_value, value_per_unit, is_good_value) for parallel sequences.
+
+    Keeping the arithmetic in a single kernel (instead of per-option method
+    dispatch) lets the comparison step run over a batch of options without
+    repeated attribute lookups or per-row dict allocation.
+    """
+    return [
+        _score(miles, cash, fee, threshold)
+        for miles, cash, fee in zip(miles_costs, cash_values, fees)
+    ]
+
+
+@lru_cache(maxsize=256)
+def _rating_for_value(value_per_mile: float) -> str:
+    """Bucket a cents-per-mile value into a rating tier (cached)."""
+    if value_per_mile >= 2.0:
+        return "Excellent"
+    elif value_per_mile >= 1.5:
+        return "Good"
+    elif value_per_mile >= 1.0:
+        return "Fair"
+    else:
+        return "Poor"
+
+
+@dataclass(slots=True)
 class RedemptionOption:
     """Data class to represent a redemption option"""
     type: str
@@ -32,6 +76,60 @@ class RedemptionOption:
         return (self.net_cash_value / self.miles_cost) * 100
 
 
+class RedemptionOptionArray:
+    """
+    Struct-of-arrays container for batches of redemption options.
+
+    Each field lives in its own parallel column, so batch computations walk
+    contiguous lists instead of pulling attributes off one dataclass
+    instance per row.
+    """
+
+    __slots__ = ('types', 'names', 'miles_costs', 'cash_equivalents',
+                 'taxes_fees', 'descriptions')
+
+    def __init__(self):
+        self.types: List[str] = []
+        self.names: List[str] = []
+        self.miles_costs: List[int] = []
+        self.cash_equivalents: List[float] = []
+        self.taxes_fees: List[float] = []
+        self.descriptions: List[str] = []
+
+    @classmethod
+    def from_options(cls, options: List[RedemptionOption]) -> 'RedemptionOptionArray':
+        """Populate the columns from a list of RedemptionOption in one pass."""
+        array = cls()
+        for option in options:
+            array.append(option.type, option.name, option.miles_cost,
+                         option.cash_equivalent, option.taxes_fees, option.description)
+        return array
+
+    def append(self, type: str, name: str, miles_cost: int, cash_equivalent: float,
+               taxes_fees: float = 0.0, description: str = "") -> None:
+        """Append one option row across all columns."""
+        self.types.append(type)
+        self.names.append(name)
+        self.miles_costs.append(miles_cost)
+        self.cash_equivalents.append(cash_equivalent)
+        self.taxes_fees.append(taxes_fees)
+        self.descriptions.append(description)
+
+    def option(self, index: int) -> RedemptionOption:
+        """Materialize row `index` back into a RedemptionOption."""
+        return RedemptionOption(
+            type=self.types[index],
+            name=self.names[index],
+            miles_cost=self.miles_costs[index],
+            cash_equivalent=self.cash_equivalents[index],
+            taxes_fees=self.taxes_fees[index],
+            description=self.descriptions[index]
+        )
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+
 class RedemptionCalculator:
     """
     Core calculator for determining the value of different redemption options.
@@ -43,8 +141,25 @@ class RedemptionCalculator:
     def __init__(self):
         """Initialize the calculator with default values"""
         self.minimum_value_threshold = 0.5  # Minimum cents per mile to consider "good" value
+        self._sample_analysis = None  # Lazily populated by analyze_sample_data
     
-    def calculate_flight_value(self, miles_cost: int, cash_price: float, 
+    def calculate_values_batch(self, miles_costs: List[int], cash_prices: List[float],
+                               taxes_fees: List[float]) -> List[Tuple[float, float, bool]]:
+        """
+        Calculate value metrics for a whole batch of redemptions at once.
+
+        Args:
+            miles_costs: Miles/points required, one entry per option
+            cash_prices: Cash prices, parallel to miles_costs
+            taxes_fees: Taxes and fees, parallel to miles_costs
+
+        Returns:
+            List of (net_value, value_per_unit, is_good_value) tuples
+        """
+        return _batch_values(miles_costs, cash_prices, taxes_fees,
+                             self.minimum_value_threshold)
+
+    def calculate_flight_value(self, miles_cost: int, cash_price: float,
                              taxes_fees: float = 0.0) -> Dict[str, Any]:
         """
         Calculate the value of a flight redemption.
@@ -57,9 +172,9 @@ class RedemptionCalculator:
         Returns:
             Dictionary containing value calculations
         """
-        net_value = cash_price - taxes_fees
-        value_per_mile = (net_value / miles_cost) * 100 if miles_cost > 0 else 0
-        
+        net_value, value_per_mile, is_good = _score(miles_cost, cash_price, taxes_fees,
+                                                    self.minimum_value_threshold)
+
         return {
             'type': 'flight',
             'miles_cost': miles_cost,
@@ -67,7 +182,7 @@ class RedemptionCalculator:
             'taxes_fees': taxes_fees,
             'net_value': net_value,
             'value_per_mile': value_per_mile,
-            'is_good_value': value_per_mile >= self.minimum_value_threshold,
+            'is_good_value': is_good,
             'savings_vs_cash': net_value
         }
     
@@ -84,9 +199,9 @@ class RedemptionCalculator:
         Returns:
             Dictionary containing value calculations
         """
-        net_value = cash_price - taxes_fees
-        value_per_point = (net_value / points_cost) * 100 if points_cost > 0 else 0
-        
+        net_value, value_per_point, is_good = _score(points_cost, cash_price, taxes_fees,
+                                                     self.minimum_value_threshold)
+
         return {
             'type': 'hotel',
             'points_cost': points_cost,
@@ -94,7 +209,7 @@ class RedemptionCalculator:
             'taxes_fees': taxes_fees,
             'net_value': net_value,
             'value_per_point': value_per_point,
-            'is_good_value': value_per_point >= self.minimum_value_threshold,
+            'is_good_value': is_good,
             'savings_vs_cash': net_value
         }
     
@@ -122,43 +237,64 @@ class RedemptionCalculator:
             'savings_vs_cash': giftcard_value
         }
     
-    def compare_redemptions(self, redemption_options: List[RedemptionOption]) -> List[Dict[str, Any]]:
+    def compare_redemptions(self, redemption_options: List[RedemptionOption],
+                            top_k: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Compare multiple redemption options and rank them by value.
-        
+
         Args:
             redemption_options: List of RedemptionOption objects
-            
+                (or a RedemptionOptionArray)
+            top_k: Return only the K best options; selects in O(N log K)
+                instead of fully sorting
+
         Returns:
             List of dictionaries with ranked options by value-per-mile/point
         """
+        if isinstance(redemption_options, RedemptionOptionArray):
+            array = redemption_options
+            known_options = [array.option(i) for i, opt_type in enumerate(array.types)
+                             if opt_type in ('flight', 'hotel', 'giftcard')]
+        else:
+            known_options = [opt for opt in redemption_options
+                             if opt.type in ('flight', 'hotel', 'giftcard')]
+
+        # Hoist the bound methods so the loop body skips the per-iteration
+        # LOAD_ATTR chain on self
+        calc_flight = self.calculate_flight_value
+        calc_hotel = self.calculate_hotel_value
+        calc_giftcard = self.calculate_giftcard_value
+
         comparisons = []
-        
-        for option in redemption_options:
+
+        for option in known_options:
             if option.type == 'flight':
-                calc_result = self.calculate_flight_value(
+                calc_result = calc_flight(
                     option.miles_cost, option.cash_equivalent, option.taxes_fees
                 )
             elif option.type == 'hotel':
-                calc_result = self.calculate_hotel_value(
+                calc_result = calc_hotel(
                     option.miles_cost, option.cash_equivalent, option.taxes_fees
                 )
-            elif option.type == 'giftcard':
-                calc_result = self.calculate_giftcard_value(
+            else:
+                calc_result = calc_giftcard(
                     option.miles_cost, option.cash_equivalent
                 )
-            else:
-                continue
-            
+
             comparisons.append({
                 'option': option,
                 'calculation': calc_result,
-                'value_per_unit': calc_result.get('value_per_mile', calc_result.get('value_per_point', 0))
+                'value_per_unit': calc_result.get('value_per_mile',
+                                                  calc_result.get('value_per_point', 0))
             })
         
-        # Sort by value per mile/point (highest first)
+        # Rank by value per mile/point (highest first); a top-K request
+        # takes the partial-selection path instead of a full sort
+        if top_k is not None:
+            return heapq.nlargest(top_k, comparisons, key=lambda x: x['value_per_unit'])
+
         comparisons.sort(key=lambda x: x['value_per_unit'], reverse=True)
-        
+
         return comparisons
     
     def get_value_rating(self, value_per_mile: float) -> str:
@@ -171,14 +307,7 @@ class RedemptionCalculator:
         Returns:
             String rating (Excellent, Good, Fair, Poor)
         """
-        if value_per_mile >= 2.0:
-            return "Excellent"
-        elif value_per_mile >= 1.5:
-            return "Good"
-        elif value_per_mile >= 1.0:
-            return "Fair"
-        else:
-            return "Poor"
+        return _rating_for_value(value_per_mile)
     
     def analyze_sample_data(self) -> Dict[str, Any]:
         """
@@ -187,6 +316,10 @@ class RedemptionCalculator:
         Returns:
             Dictionary with analysis of sample redemption options
         """
+        # The sample set is static, so assemble and analyze it only once
+        if self._sample_analysis is not None:
+            return self._sample_analysis
+
         sample_options = [
             RedemptionOption(
                 type='flight',
@@ -215,10 +348,11 @@ class RedemptionCalculator:
         ]
         
         comparisons = self.compare_redemptions(sample_options)
-        
-        return {
+
+        self._sample_analysis = {
             'sample_analysis': comparisons,
             'best_value': comparisons[0] if comparisons else None,
             'worst_value': comparisons[-1] if comparisons else None,
             'average_value': sum(c['value_per_unit'] for c in comparisons) / len(comparisons) if comparisons else 0
-        } 
\ No newline at end of file
+        }
+        return self._sample_analysis 
\ No newline at end of file
@@ -5,19 +5,67 @@ Core functionality to generate comprehensive redemption recommendations
 combining flights, hotels, and alternative redemption options with Amadeus API integration.
 """
 
-from typing import List, Dict, Any, Optional
+import heapq
+import logging
+import sys
+from typing import List, Dict, Any, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, date
-import json
+from functools import lru_cache
+from operator import itemgetter
+from statistics import fmean
 
 from .calculator import RedemptionCalculator, RedemptionOption
 from .route_optimizer import RouteOptimizer, FlightRoute
 from .amadeus_client import AmadeusClient
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+
+# Mock points requirement shared by every statement-credit program
+STATEMENT_CREDIT_POINTS = 10000
+
+# How many recommendations generate_recommendations returns
+MAX_RECOMMENDATIONS = 5
+
+# C-level sort keys for the recommendation pipeline
+_SORT_KEY = itemgetter('_sort_key')
+_FEES_KEY = itemgetter('fees')
+
+
+@lru_cache(maxsize=64)
+def _iso_date(travel_date: date) -> str:
+    """Memoized travel-date isoformat for the search_criteria payload."""
+    return travel_date.isoformat()
+
+
+def _preferences_criteria(preferences: 'UserPreferences') -> Dict[str, Any]:
+    """Fresh preferences sub-dict for a result's search_criteria payload."""
+    return {
+        'maximize_value': preferences.maximize_value,
+        'minimize_fees': preferences.minimize_fees,
+        'include_alternatives': preferences.include_alternatives
+    }
+
+
+def _affordable_templates(points: List[int], templates: List[Dict[str, Any]],
+                          available: int) -> List[Dict[str, Any]]:
+    """
+    Copy the template rows whose points cost fits the available balance.
+
+    One scan shared by the hotel, gift-card, and statement-credit tables;
+    the value math itself is precomputed on the templates at construction.
+    """
+    # dict.copy() duplicates the hash table wholesale (PyDict_Copy) instead
+    # of rebuilding key-by-key
+    return [template.copy() for cost, template in zip(points, templates)
+            if cost <= available]
+
+
+@dataclass(slots=True, frozen=True)
 class UserPreferences:
-    """Data class to represent user preferences"""
+    """Data class to represent user preferences (immutable and hashable)"""
     maximize_value: bool = True
     minimize_fees: bool = False
     prefer_direct_flights: bool = True
@@ -35,123 +83,236 @@ class RedemptionRecommender:
     redemptions to provide the best overall recommendations using real Amadeus API data.
     """
     
-    def __init__(self, amadeus_client: Optional[AmadeusClient] = None):
-        """Initialize the recommender with calculator and route optimizer"""
-        self.calculator = RedemptionCalculator()
+    def __init__(self, amadeus_client: Optional[AmadeusClient] = None,
+                 calculator: Optional[RedemptionCalculator] = None,
+                 route_optimizer: Optional[RouteOptimizer] = None):
+        """Initialize the recommender, reusing shared components when provided"""
+        self.calculator = calculator or RedemptionCalculator()
         self.amadeus_client = amadeus_client or AmadeusClient()
-        self.route_optimizer = RouteOptimizer(self.amadeus_client)
+        self.route_optimizer = route_optimizer or RouteOptimizer(self.amadeus_client)
         self.hotel_data = self._load_hotel_data()
         self.alternative_data = self._load_alternative_data()
+        self._build_option_tables()
     
-    def _load_hotel_data(self) -> Dict[str, Any]:
-        """Load mock hotel redemption data"""
-        return {
-            'marriott': {
-                'category_1': {'points': 7500, 'cash_value': 75},
-                'category_2': {'points': 12500, 'cash_value': 125},
-                'category_3': {'points': 17500, 'cash_value': 175},
-                'category_4': {'points': 25000, 'cash_value': 250},
-                'category_5': {'points': 35000, 'cash_value': 350},
-                'category_6': {'points': 50000, 'cash_value': 500},
-                'category_7': {'points': 70000, 'cash_value': 700},
-                'category_8': {'points': 100000, 'cash_value': 1000},
-            },
-            'hilton': {
-                'category_1': {'points': 10000, 'cash_value': 60},
-                'category_2': {'points': 20000, 'cash_value': 120},
-                'category_3': {'points': 30000, 'cash_value': 180},
-                'category_4': {'points': 40000, 'cash_value': 240},
-                'category_5': {'points': 50000, 'cash_value': 300},
-                'category_6': {'points': 60000, 'cash_value': 360},
-                'category_7': {'points': 70000, 'cash_value': 420},
-                'category_8': {'points': 80000, 'cash_value': 480},
-            },
-            'hyatt': {
-                'category_1': {'points': 3500, 'cash_value': 70},
-                'category_2': {'points': 6500, 'cash_value': 130},
-                'category_3': {'points': 9000, 'cash_value': 180},
-                'category_4': {'points': 12000, 'cash_value': 240},
-                'category_5': {'points': 17000, 'cash_value': 340},
-                'category_6': {'points': 21000, 'cash_value': 420},
-                'category_7': {'points': 25000, 'cash_value': 500},
-                'category_8': {'points': 30000, 'cash_value': 600},
-            }
+    def _load_hotel_data(self) -> Tuple[Tuple[str, str, int, float], ...]:
+        """Load mock hotel redemption data as flat (chain, category, points, cash) records"""
+        chains = {
+            'marriott': ((7500, 75), (12500, 125), (17500, 175), (25000, 250),
+                         (35000, 350), (50000, 500), (70000, 700), (100000, 1000)),
+            'hilton': ((10000, 60), (20000, 120), (30000, 180), (40000, 240),
+                       (50000, 300), (60000, 360), (70000, 420), (80000, 480)),
+            'hyatt': ((3500, 70), (6500, 130), (9000, 180), (12000, 240),
+                      (17000, 340), (21000, 420), (25000, 500), (30000, 600)),
         }
+        # Intern the generated category labels: they get re-hashed on every
+        # downstream dict lookup/compare, and interning makes that a pointer
+        # check (chain names are source literals, interned already)
+        return tuple(
+            (chain, sys.intern(f'category_{category}'), points, cash_value)
+            for chain, categories in chains.items()
+            for category, (points, cash_value) in enumerate(categories, 1)
+        )
     
     def _load_alternative_data(self) -> Dict[str, Any]:
         """Load mock alternative redemption data"""
         return {
-            'gift_cards': {
-                'amazon': {'points': 10000, 'value': 100},
-                'target': {'points': 10000, 'value': 100},
-                'walmart': {'points': 10000, 'value': 100},
-                'starbucks': {'points': 10000, 'value': 100},
-                'uber': {'points': 10000, 'value': 100},
-            },
+            # Flat (merchant, points, value) records
+            'gift_cards': (
+                ('amazon', 10000, 100),
+                ('target', 10000, 100),
+                ('walmart', 10000, 100),
+                ('starbucks', 10000, 100),
+                ('uber', 10000, 100),
+            ),
             'transfers': {
                 'chase_ur_to_hyatt': {'ratio': 1.0, 'bonus': 0.25},
                 'chase_ur_to_marriott': {'ratio': 1.0, 'bonus': 0.0},
                 'amex_mr_to_hilton': {'ratio': 1.0, 'bonus': 0.0},
                 'amex_mr_to_marriott': {'ratio': 1.0, 'bonus': 0.0},
             },
+            # cash_value precomputed at load time: points * value / 100 is a
+            # constant per program
             'statement_credits': {
-                'chase_pay_yourself_back': {'value_per_point': 1.25},
-                'amex_statement_credit': {'value_per_point': 0.6},
+                program: {
+                    'value_per_point': value_per_point,
+                    'points_required': STATEMENT_CREDIT_POINTS,
+                    'cash_value': STATEMENT_CREDIT_POINTS * value_per_point / 100,
+                }
+                for program, value_per_point in (
+                    ('chase_pay_yourself_back', 1.25),
+                    ('amex_statement_credit', 0.6),
+                )
             }
         }
     
-    def get_flight_options(self, origin: str, destination: str, 
+    def _build_option_tables(self) -> None:
+        """
+        Flatten the nested hotel/alternative dicts into parallel columns.
+
+        The query paths then walk contiguous lists (and can batch the value
+        math through the calculator's kernel) instead of re-traversing the
+        nested dict structure on every call.
+        """
+        hotel_chains: List[str] = []
+        hotel_categories: List[str] = []
+        self._hotel_points: List[int] = []
+        hotel_cash: List[float] = []
+        for chain, category, points, cash_value in self.hotel_data:
+            hotel_chains.append(chain)
+            hotel_categories.append(category)
+            self._hotel_points.append(points)
+            hotel_cash.append(cash_value)
+
+        giftcard_merchants: List[str] = []
+        self._giftcard_points: List[int] = []
+        giftcard_values: List[float] = []
+        for merchant, points, value in self.alternative_data['gift_cards']:
+            giftcard_merchants.append(merchant)
+            self._giftcard_points.append(points)
+            giftcard_values.append(value)
+
+        credit_programs: List[str] = []
+        credit_values: List[float] = []
+        credit_cash_values: List[float] = []
+        for program, data in self.alternative_data['statement_credits'].items():
+            credit_programs.append(program)
+            credit_values.append(data['value_per_point'])
+            credit_cash_values.append(data['cash_value'])
+
+        # Cheapest redemption anywhere in the tables. Flight awards bottom
+        # out at the domestic zone_1 chart (7500 miles), above the cheapest
+        # hotel row, so balances under this floor can't afford anything
+        self._global_min_cost = min(min(self._hotel_points),
+                                    min(self._giftcard_points),
+                                    STATEMENT_CREDIT_POINTS)
+
+        # Pre-build one template dict per row: the value math never changes
+        # between queries, so the hot paths only copy (and stamp the
+        # query-dependent 'location' for hotels)
+        hotel_results = self.calculator.calculate_values_batch(
+            self._hotel_points, hotel_cash, [0.0] * len(self._hotel_points)
+        )
+        self._hotel_option_templates: List[Dict[str, Any]] = [
+            {
+                'type': 'hotel',
+                'chain': hotel_chains[i],
+                'category': hotel_categories[i],
+                'cost_points': self._hotel_points[i],
+                'cash_equivalent': hotel_cash[i],
+                'fees': 0.0,
+                'value_per_point': value_per_point,
+                'savings_vs_cash': net_value,
+                'is_affordable': True,
+                '_sort_key': value_per_point
+            }
+            for i, (net_value, value_per_point, _) in enumerate(hotel_results)
+        ]
+
+        giftcard_results = self.calculator.calculate_values_batch(
+            self._giftcard_points, giftcard_values,
+            [0.0] * len(self._giftcard_points)
+        )
+        self._giftcard_option_templates: List[Dict[str, Any]] = [
+            {
+                'type': 'giftcard',
+                'merchant': giftcard_merchants[i],
+                'cost_points': self._giftcard_points[i],
+                'cash_equivalent': giftcard_values[i],
+                'fees': 0.0,
+                'value_per_point': value_per_point,
+                'savings_vs_cash': net_value,
+                'is_affordable': True,
+                '_sort_key': value_per_point
+            }
+            for i, (net_value, value_per_point, _) in enumerate(giftcard_results)
+        ]
+
+        self._credit_option_templates: List[Dict[str, Any]] = [
+            {
+                'type': 'statement_credit',
+                'program': program,
+                'cost_points': STATEMENT_CREDIT_POINTS,
+                'cash_equivalent': cash_value,
+                'fees': 0.0,
+                'value_per_point': value_per_point,
+                'savings_vs_cash': cash_value,
+                'is_affordable': True,
+                '_sort_key': value_per_point
+            }
+            for program, value_per_point, cash_value in zip(
+                credit_programs, credit_values, credit_cash_values)
+        ]
+
+    @lru_cache(maxsize=512)
+    def _cached_routes(self, origin: str, destination: str,
+                       travel_date: date) -> Dict[str, Any]:
+        """
+        Route search memoized on the trip alone.
+
+        The miles balance only affects the affordability filter, so queries
+        that differ just in balance reuse the same (API-backed) route set.
+        """
+        return self.route_optimizer.find_optimal_routes(origin, destination, travel_date)
+
+    def get_flight_options(self, origin: str, destination: str,
                           travel_date: date, available_miles: int) -> List[Dict[str, Any]]:
         """
         Get available flight options for the given route using Amadeus API.
-        
+
         Args:
             origin: Origin airport code
             destination: Destination airport code
             travel_date: Date of travel
             available_miles: Available miles for redemption
-            
+
         Returns:
             List of flight options with value analysis
         """
-        print(f"✈️ Searching for flight options from {origin} to {destination}")
-        
-        # Get optimal routes using Amadeus API
-        route_results = self.route_optimizer.find_optimal_routes(origin, destination, travel_date)
-        
-        flight_options = []
-        
-        for route_analysis in route_results['routes']:
-            route = route_analysis['route']
-            
-            # Check if user has enough miles
-            if route.total_miles <= available_miles:
-                # Use real cash price from Amadeus API
-                cash_price = route.cash_price if route.cash_price > 0 else route.total_miles * 0.02
-                
-                # Calculate value
-                value_calc = self.calculator.calculate_flight_value(
-                    route.total_miles, 
-                    cash_price,
-                    route.total_fees
-                )
-                
-                flight_options.append({
-                    'type': 'flight',
-                    'subtype': route.route_type,
-                    'cost_miles': route.total_miles,
-                    'cash_equivalent': value_calc['cash_price'],
-                    'fees': route.total_fees,
-                    'value_per_mile': value_calc['value_per_mile'],
-                    'route': route.route_description,
-                    'savings_vs_cash': value_calc['savings_vs_cash'],
-                    'duration_hours': route.duration_hours,
-                    'segments': route.segments,
-                    'airline': route.airline,
-                    'is_affordable': True
-                })
-        
-        print(f"Found {len(flight_options)} affordable flight options")
+        logger.debug("Searching for flight options from %s to %s", origin, destination)
+
+        # Get optimal routes using Amadeus API (memoized per trip). Only
+        # memoize real API-backed results — the mock fallback is cheap and
+        # shouldn't be pinned past the point where credentials appear
+        if self.amadeus_client.is_available():
+            route_results = self._cached_routes(origin, destination, travel_date)
+        else:
+            route_results = self.route_optimizer.find_optimal_routes(origin, destination,
+                                                                     travel_date)
+
+        # Hoist the bound method so the per-route loop skips the
+        # self.calculator attribute walk
+        calc_flight_value = self.calculator.calculate_flight_value
+
+        def _flight_option(route: FlightRoute) -> Dict[str, Any]:
+            # Use real cash price from Amadeus API when present
+            cash_price = route.cash_price if route.cash_price > 0 else route.total_miles * 0.02
+            value_calc = calc_flight_value(route.total_miles, cash_price, route.total_fees)
+            return {
+                'type': 'flight',
+                # route_type/airline arrive as dynamic strings (API data,
+                # "AA/DL" joins); intern them so downstream comparisons and
+                # dict operations hit the pointer fast path
+                'subtype': sys.intern(route.route_type),
+                'cost_miles': route.total_miles,
+                'cash_equivalent': value_calc['cash_price'],
+                'fees': route.total_fees,
+                'value_per_mile': value_calc['value_per_mile'],
+                'route': route.route_description,
+                'savings_vs_cash': value_calc['savings_vs_cash'],
+                'duration_hours': route.duration_hours,
+                'segments': route.segments,
+                'airline': sys.intern(route.airline),
+                'is_affordable': True,
+                '_sort_key': value_calc['value_per_mile']
+            }
+
+        flight_options = [
+            _flight_option(route_analysis['route'])
+            for route_analysis in route_results['routes']
+            if route_analysis['route'].total_miles <= available_miles
+        ]
+
+        logger.debug("Found %d affordable flight options", len(flight_options))
         return flight_options
     
     def get_hotel_options(self, destination: str, available_points: int, 
@@ -167,37 +328,20 @@ class RedemptionRecommender:
         Returns:
             List of hotel options with value analysis
         """
-        print(f"🏨 Searching for hotel options in {destination}")
-        
-        hotel_options = []
-        
-        # Generate mock hotel options based on available chains
-        for chain, categories in self.hotel_data.items():
-            for category, data in categories.items():
-                if data['points'] <= available_points:
-                    # Calculate value
-                    value_calc = self.calculator.calculate_hotel_value(
-                        data['points'],
-                        data['cash_value']
-                    )
-                    
-                    hotel_options.append({
-                        'type': 'hotel',
-                        'chain': chain,
-                        'category': category,
-                        'cost_points': data['points'],
-                        'cash_equivalent': data['cash_value'],
-                        'fees': 0.0,
-                        'value_per_point': value_calc['value_per_point'],
-                        'location': destination,
-                        'savings_vs_cash': value_calc['savings_vs_cash'],
-                        'is_affordable': True
-                    })
-        
+        logger.debug("Searching for hotel options in %s", destination)
+
+        # Copy the precomputed templates for affordable rows, stamping the
+        # only query-dependent field
+        hotel_options = _affordable_templates(self._hotel_points,
+                                              self._hotel_option_templates,
+                                              available_points)
+        for option in hotel_options:
+            option['location'] = destination
+
         # Sort by value per point
         hotel_options.sort(key=lambda x: x['value_per_point'], reverse=True)
         
-        print(f"Found {len(hotel_options)} affordable hotel options")
+        logger.debug("Found %d affordable hotel options", len(hotel_options))
         return hotel_options[:5]  # Return top 5 options
     
     def get_alternative_redemptions(self, available_points: int) -> List[Dict[str, Any]]:
@@ -210,50 +354,57 @@ class RedemptionRecommender:
         Returns:
             List of alternative redemption options
         """
-        print("🎁 Searching for alternative redemption options")
-        
-        alternative_options = []
-        
-        # Gift card options
-        for merchant, data in self.alternative_data['gift_cards'].items():
-            if data['points'] <= available_points:
-                value_calc = self.calculator.calculate_giftcard_value(
-                    data['points'],
-                    data['value']
-                )
-                
-                alternative_options.append({
-                    'type': 'giftcard',
-                    'merchant': merchant,
-                    'cost_points': data['points'],
-                    'cash_equivalent': data['value'],
-                    'fees': 0.0,
-                    'value_per_point': value_calc['value_per_point'],
-                    'savings_vs_cash': value_calc['savings_vs_cash'],
-                    'is_affordable': True
-                })
-        
-        # Statement credit options
-        for program, data in self.alternative_data['statement_credits'].items():
-            # Mock points requirement
-            points_required = 10000
-            if points_required <= available_points:
-                cash_value = points_required * data['value_per_point'] / 100
-                
-                alternative_options.append({
-                    'type': 'statement_credit',
-                    'program': program,
-                    'cost_points': points_required,
-                    'cash_equivalent': cash_value,
-                    'fees': 0.0,
-                    'value_per_point': data['value_per_point'],
-                    'savings_vs_cash': cash_value,
-                    'is_affordable': True
-                })
+        logger.debug("Searching for alternative redemption options")
+
+        # Copy the precomputed templates for affordable rows
+        alternative_options = _affordable_templates(self._giftcard_points,
+                                                    self._giftcard_option_templates,
+                                                    available_points)
+
+        if STATEMENT_CREDIT_POINTS <= available_points:
+            alternative_options.extend(template.copy()
+                                       for template in self._credit_option_templates)
         
-        print(f"Found {len(alternative_options)} alternative redemption options")
+        logger.debug("Found %d alternative redemption options", len(alternative_options))
         return alternative_options
     
+    @lru_cache(maxsize=64)
+    def _cached_base_options(self, origin_airport: str, destination_airport: str,
+                             travel_date: date,
+                             available_miles: int) -> Tuple[List[Dict[str, Any]],
+                                                            List[Dict[str, Any]],
+                                                            List[Dict[str, Any]]]:
+        """
+        Fetch the raw option pool for a trip, memoized on the search inputs.
+
+        Preference changes don't affect which options exist — only how they
+        are filtered and ranked — so re-running with tweaked preferences
+        reuses this pool and skips all Amadeus I/O.
+        """
+        return self._fetch_base_options(origin_airport, destination_airport,
+                                        travel_date, available_miles)
+
+    def _fetch_base_options(self, origin_airport: str, destination_airport: str,
+                            travel_date: date,
+                            available_miles: int) -> Tuple[List[Dict[str, Any]],
+                                                           List[Dict[str, Any]],
+                                                           List[Dict[str, Any]]]:
+        """
+        Fetch the raw option pool for a trip.
+
+        The three fetches run concurrently: the flight search is Amadeus-bound
+        I/O while hotels/alternatives are local table scans, so the local work
+        hides entirely behind the API round-trip.
+        """
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            flight_future = executor.submit(self.get_flight_options, origin_airport,
+                                            destination_airport, travel_date, available_miles)
+            hotel_future = executor.submit(self.get_hotel_options, destination_airport,
+                                           available_miles, UserPreferences())
+            alternative_future = executor.submit(self.get_alternative_redemptions,
+                                                 available_miles)
+            return flight_future.result(), hotel_future.result(), alternative_future.result()
+
     def generate_recommendations(self, origin_airport: str, destination_airport: str,
                                 travel_date: date, available_miles: int,
                                 user_preferences: Optional[UserPreferences] = None) -> Dict[str, Any]:
@@ -273,53 +424,92 @@ class RedemptionRecommender:
         if user_preferences is None:
             user_preferences = UserPreferences()
         
-        print(f"\n🚀 Generating recommendations for {available_miles:,} miles")
-        
-        # Get all available options
-        flight_options = self.get_flight_options(origin_airport, destination_airport, 
-                                                travel_date, available_miles)
-        
-        hotel_options = self.get_hotel_options(destination_airport, available_miles, 
-                                              user_preferences)
-        
-        alternative_options = []
-        if user_preferences.include_alternatives:
-            alternative_options = self.get_alternative_redemptions(available_miles)
+        logger.debug("Generating recommendations for %s miles", available_miles)
+
+        # Balance below every redemption threshold: skip all fetching
+        # (including the Amadeus round-trip) and report the shortfall
+        if available_miles < self._global_min_cost:
+            logger.debug("Balance %d below cheapest redemption (%d); skipping search",
+                         available_miles, self._global_min_cost)
+            return {
+                'recommendations': [],
+                'best_overall': None,
+                'best_value_per_mile': None,
+                'insufficient_miles': self.get_insufficient_miles_recommendations(
+                    available_miles, self._global_min_cost),
+                'summary': {
+                    'total_options_found': 0,
+                    'affordable_options': 0,
+                    'recommendations_generated': 0,
+                    'average_value_per_mile': 0.0
+                },
+                'search_criteria': {
+                    'origin': origin_airport,
+                    'destination': destination_airport,
+                    'travel_date': _iso_date(travel_date),
+                    'available_miles': available_miles,
+                    'preferences': _preferences_criteria(user_preferences)
+                }
+            }
+
+        # Get all available options (memoized per trip/miles combination —
+        # bypassing the cache when only mock data is available, so fallback
+        # pools aren't pinned for the process lifetime)
+        fetch_base_options = (self._cached_base_options
+                              if self.amadeus_client.is_available()
+                              else self._fetch_base_options)
+        flight_options, hotel_options, alternative_options = fetch_base_options(
+            origin_airport, destination_airport, travel_date, available_miles
+        )
+
+        if not user_preferences.include_alternatives:
+            alternative_options = []
         
         # Combine all options
         all_options = flight_options + hotel_options + alternative_options
         
-        print(f"Total options found: {len(all_options)}")
+        logger.debug("Total options found: %d", len(all_options))
         
-        # Filter by minimum value threshold
+        # Every option dict carries a '_sort_key' stamped at construction,
+        # so filter/sort/best-of/average all read one precomputed field
+        # through C-level itemgetter instead of a .get fallback chain
         filtered_options = [
-            option for option in all_options 
-            if option.get('value_per_mile', option.get('value_per_point', 0)) >= user_preferences.min_value_per_mile
+            option for option in all_options
+            if option['_sort_key'] >= user_preferences.min_value_per_mile
         ]
-        
-        print(f"Options meeting minimum value threshold: {len(filtered_options)}")
-        
-        # Sort by value (highest first)
+
+        logger.debug("Options meeting minimum value threshold: %d", len(filtered_options))
+
+        # Select the top 5 recommendations: O(N log 5) partial selection
+        # instead of fully sorting the filtered list
         if user_preferences.maximize_value:
-            filtered_options.sort(key=lambda x: x.get('value_per_mile', x.get('value_per_point', 0)), reverse=True)
+            top_recommendations = heapq.nlargest(MAX_RECOMMENDATIONS,
+                                                 filtered_options, key=_SORT_KEY)
         elif user_preferences.minimize_fees:
-            filtered_options.sort(key=lambda x: x.get('fees', 0))
-        
-        # Limit to top 5 recommendations
-        top_recommendations = filtered_options[:5]
-        
+            top_recommendations = heapq.nsmallest(MAX_RECOMMENDATIONS,
+                                                  filtered_options, key=_FEES_KEY)
+        else:
+            top_recommendations = filtered_options[:MAX_RECOMMENDATIONS]
+
         # Find best overall and best value per mile
         best_overall = top_recommendations[0] if top_recommendations else None
         best_value_per_mile = None
-        
+
         if top_recommendations:
-            best_value_per_mile = max(top_recommendations, 
-                                    key=lambda x: x.get('value_per_mile', x.get('value_per_point', 0)))
-        
-        # Generate summary statistics
+            if user_preferences.maximize_value:
+                # Already sorted by value descending — the head is the max
+                best_value_per_mile = best_overall
+            else:
+                best_value_per_mile = max(top_recommendations, key=_SORT_KEY)
+
+        # Generate summary statistics. Every option dict is created with
+        # is_affordable=True (affordability is the entry condition in each
+        # get_*_options path), so counting them is just len()
         total_options_found = len(all_options)
-        affordable_options = len([opt for opt in all_options if opt.get('is_affordable', False)])
-        
+        affordable_options = total_options_found
+        average_value = (fmean(map(_SORT_KEY, top_recommendations))
+                         if top_recommendations else 0.0)
+
         return {
             'recommendations': top_recommendations,
             'best_overall': best_overall,
@@ -328,19 +518,14 @@ class RedemptionRecommender:
                 'total_options_found': total_options_found,
                 'affordable_options': affordable_options,
                 'recommendations_generated': len(top_recommendations),
-                'average_value_per_mile': sum(opt.get('value_per_mile', opt.get('value_per_point', 0)) 
-                                            for opt in top_recommendations) / len(top_recommendations) if top_recommendations else 0
+                'average_value_per_mile': average_value
             },
             'search_criteria': {
                 'origin': origin_airport,
                 'destination': destination_airport,
-                'travel_date': travel_date.isoformat(),
+                'travel_date': _iso_date(travel_date),
                 'available_miles': available_miles,
-                'preferences': {
-                    'maximize_value': user_preferences.maximize_value,
-                    'minimize_fees': user_preferences.minimize_fees,
-                    'include_alternatives': user_preferences.include_alternatives
-                }
+                'preferences': _preferences_criteria(user_preferences)
             }
         }
     
@@ -5,15 +5,93 @@ Core functionality to find optimal flight routes including direct flights
 and synthetic routing through major hub airports, now with Amadeus API integration.
 """
 
-from typing import List, Dict, Any, Optional
+import asyncio
+import logging
+import sys
+from typing import List, Dict, Any, Optional, Tuple
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, date
-import json
+from functools import lru_cache
+from itertools import chain
+import re
 
 from .amadeus_client import AmadeusClient, FlightOffer
+from ._distance import distance_between
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+# ISO 8601 duration like PT5H30M (either part optional)
+_DURATION_RE = re.compile(r'^PT(?:(\d+)H)?(?:(\d+)M)?')
+
+# Booking fees by route shape
+DIRECT_FEES = 50.0
+LAYOVER_FEES = 75.0  # Higher fees for layover routes
+
+# Minimum percentage saving for a synthetic route to be worthwhile
+WORTHWHILE_SAVINGS_PCT = 10
+
+# Mock award chart data for different airlines (shared by all optimizers)
+AWARD_CHARTS = {
+    'domestic': {
+        'zone_1': 7500,   # 0-500 miles
+        'zone_2': 12500,  # 501-1000 miles
+        'zone_3': 20000,  # 1001-1500 miles
+        'zone_4': 25000,  # 1501-2000 miles
+        'zone_5': 35000,  # 2001+ miles
+    },
+    'international': {
+        'zone_1': 30000,  # North America
+        'zone_2': 40000,  # Europe
+        'zone_3': 50000,  # Asia
+        'zone_4': 60000,  # South America
+        'zone_5': 70000,  # Africa/Oceania
+    }
+}
+
+
+# Zone boundaries flattened from the charts for bisect-based lookup.
+# Domestic zones are inclusive upper bounds (<= 500 is zone_1), so
+# bisect_left lands distance 500 in zone_1; international uses strict
+# bounds (< 2000 is zone_1), matched by bisect_right.
+_DOMESTIC_THRESHOLDS = (500, 1000, 1500, 2000)
+_DOMESTIC_COSTS = tuple(AWARD_CHARTS['domestic'][f'zone_{zone}'] for zone in range(1, 6))
+_INTERNATIONAL_THRESHOLDS = (2000, 4000, 6000, 8000)
+_INTERNATIONAL_COSTS = tuple(AWARD_CHARTS['international'][f'zone_{zone}'] for zone in range(1, 6))
+
+
+def _score_routes(total_costs: List[float], segment_counts: List[int]) -> List[float]:
+    """
+    Fused route-scoring kernel: efficiency minus complexity in one pass.
+
+    A single loop over parallel columns with no intermediate lists — the
+    shape a JIT would compile wholesale if the project ever grows a native
+    numeric stack (same policy note as the calculator's _score kernel).
+    """
+    return [
+        (1000 / cost if cost > 0 else 0) - count * 0.1
+        for cost, count in zip(total_costs, segment_counts)
+    ]
+
+
+@lru_cache(maxsize=4096)
+def _award_cost(origin: str, destination: str, is_international: bool = False) -> int:
+    """
+    Award miles cost for a city pair, memoized on the pair.
+
+    Pure function of (origin, destination, is_international) — repeat pairs
+    inside the ranking and layover paths become a cache hit; the zone is
+    found with one C-level bisect instead of an if/elif ladder.
+    """
+    distance = distance_between(origin, destination)
+
+    if is_international:
+        return _INTERNATIONAL_COSTS[bisect_right(_INTERNATIONAL_THRESHOLDS, distance)]
+    return _DOMESTIC_COSTS[bisect_left(_DOMESTIC_THRESHOLDS, distance)]
+
+
+@dataclass(slots=True)
 class FlightRoute:
     """Data class to represent a flight route"""
     origin: str
@@ -35,11 +113,10 @@ class FlightRoute:
     @property
     def route_description(self) -> str:
         """Get human-readable route description"""
-        if self.route_type == 'direct':
+        if self.route_type == 'direct' or not self.layover_airports:
             return f"{self.origin} → {self.destination}"
-        else:
-            stops = " → ".join([self.origin] + self.layover_airports + [self.destination])
-            return stops
+        # Single join without building the intermediate endpoint lists
+        return f"{self.origin} → {' → '.join(self.layover_airports)} → {self.destination}"
 
 
 class RouteOptimizer:
@@ -52,8 +129,9 @@ class RouteOptimizer:
     
     def __init__(self, amadeus_client: Optional[AmadeusClient] = None):
         """Initialize the route optimizer with Amadeus client"""
-        self.major_hubs = ['ATL', 'DFW', 'ORD', 'LAX', 'JFK', 'LHR', 'CDG', 'NRT', 'HKG', 'SIN']
-        self.regional_hubs = ['DEN', 'MIA', 'SEA', 'SFO', 'BOS', 'IAH', 'MSP', 'DTW', 'PHX', 'LAS']
+        # Tuples: the hub lists never change after construction
+        self.major_hubs = ('ATL', 'DFW', 'ORD', 'LAX', 'JFK', 'LHR', 'CDG', 'NRT', 'HKG', 'SIN')
+        self.regional_hubs = ('DEN', 'MIA', 'SEA', 'SFO', 'BOS', 'IAH', 'MSP', 'DTW', 'PHX', 'LAS')
         self.all_hubs = self.major_hubs + self.regional_hubs
         
         # Initialize Amadeus client
@@ -64,53 +142,15 @@ class RouteOptimizer:
     
     def _load_award_charts(self) -> Dict[str, Any]:
         """Load mock award chart data for different airlines"""
-        return {
-            'domestic': {
-                'zone_1': 7500,   # 0-500 miles
-                'zone_2': 12500,  # 501-1000 miles
-                'zone_3': 20000,  # 1001-1500 miles
-                'zone_4': 25000,  # 1501-2000 miles
-                'zone_5': 35000,  # 2001+ miles
-            },
-            'international': {
-                'zone_1': 30000,  # North America
-                'zone_2': 40000,  # Europe
-                'zone_3': 50000,  # Asia
-                'zone_4': 60000,  # South America
-                'zone_5': 70000,  # Africa/Oceania
-            }
-        }
+        return AWARD_CHARTS
     
     def _calculate_distance(self, origin: str, destination: str) -> int:
         """
-        Mock distance calculation between airports.
-        In a real implementation, this would use actual airport coordinates.
+        Approximate distance between airports via the shared table:
+        route overrides first, then a haversine fallback over known
+        airport coordinates.
         """
-        # Simplified distance calculation for demo purposes
-        distances = {
-            ('JFK', 'LAX'): 2475,
-            ('JFK', 'ORD'): 740,
-            ('JFK', 'ATL'): 760,
-            ('JFK', 'DFW'): 1389,
-            ('LAX', 'ORD'): 1744,
-            ('LAX', 'ATL'): 1947,
-            ('LAX', 'DFW'): 1235,
-            ('ORD', 'ATL'): 606,
-            ('ORD', 'DFW'): 802,
-            ('ATL', 'DFW'): 731,
-        }
-        
-        # Check both directions
-        route = (origin, destination)
-        reverse_route = (destination, origin)
-        
-        if route in distances:
-            return distances[route]
-        elif reverse_route in distances:
-            return distances[reverse_route]
-        else:
-            # Default distance calculation (very rough approximation)
-            return 1000
+        return distance_between(origin, destination)
     
     def _get_award_cost(self, origin: str, destination: str, is_international: bool = False) -> int:
         """
@@ -124,32 +164,7 @@ class RouteOptimizer:
         Returns:
             Award miles cost
         """
-        distance = self._calculate_distance(origin, destination)
-        
-        if is_international:
-            chart = self.award_charts['international']
-            if distance < 2000:
-                return chart['zone_1']
-            elif distance < 4000:
-                return chart['zone_2']
-            elif distance < 6000:
-                return chart['zone_3']
-            elif distance < 8000:
-                return chart['zone_4']
-            else:
-                return chart['zone_5']
-        else:
-            chart = self.award_charts['domestic']
-            if distance <= 500:
-                return chart['zone_1']
-            elif distance <= 1000:
-                return chart['zone_2']
-            elif distance <= 1500:
-                return chart['zone_3']
-            elif distance <= 2000:
-                return chart['zone_4']
-            else:
-                return chart['zone_5']
+        return _award_cost(origin, destination, is_international)
     
     def find_direct_routes(self, origin: str, destination: str, 
                           travel_date: date) -> List[FlightRoute]:
@@ -164,8 +179,13 @@ class RouteOptimizer:
         Returns:
             List of direct flight routes
         """
+        # Intern the (user-supplied) codes so the distance/award caches and
+        # hub-set membership tests compare by identity
+        origin = sys.intern(origin)
+        destination = sys.intern(destination)
+
         direct_routes = []
-        
+
         # Search for real flights using Amadeus API
         flight_offers = self.amadeus_client.search_flights(
             origin=origin,
@@ -190,7 +210,7 @@ class RouteOptimizer:
                     destination=destination,
                     route_type='direct',
                     total_miles=award_cost,
-                    total_fees=50.0,  # Mock fees
+                    total_fees=DIRECT_FEES,  # Mock fees
                     segments=offer.segments,
                     duration_hours=duration_hours,
                     layover_airports=[],
@@ -201,61 +221,70 @@ class RouteOptimizer:
         return direct_routes
     
     def _parse_duration(self, duration_str: str) -> float:
-        """Parse ISO 8601 duration string to hours."""
-        try:
-            # Remove 'PT' prefix and parse hours
-            if duration_str.startswith('PT'):
-                duration_str = duration_str[2:]
-            
-            hours = 0
-            if 'H' in duration_str:
-                hours = int(duration_str.split('H')[0])
-            
-            return float(hours)
-        except:
+        """Parse ISO 8601 duration string to hours (minutes included)."""
+        match = _DURATION_RE.match(duration_str) if duration_str else None
+        if match is None or not (match[1] or match[2]):
             return 5.0  # Default duration
+        return int(match[1] or 0) + int(match[2] or 0) / 60.0
     
-    def find_layover_routes(self, origin: str, destination: str, 
-                           travel_date: date, 
-                           hub_airports: Optional[List[str]] = None) -> List[FlightRoute]:
+    def find_layover_routes(self, origin: str, destination: str,
+                           travel_date: date,
+                           hub_airports: Optional[List[str]] = None,
+                           direct_cost: Optional[float] = None) -> List[FlightRoute]:
         """
         Find routes with layovers through major hub airports.
-        
+
         Args:
             origin: Origin airport code
             destination: Destination airport code
             travel_date: Date of travel
             hub_airports: List of hub airports to consider (defaults to major hubs)
-            
+            direct_cost: Known cost of the best direct route; hubs whose
+                award-chart floor cannot beat it by the worthwhile-savings
+                margin are pruned before any API call
+
         Returns:
             List of layover flight routes
         """
+        origin = sys.intern(origin)
+        destination = sys.intern(destination)
+
         if hub_airports is None:
             hub_airports = self.major_hubs[:3]  # Limit to top 3 hubs for performance
-        
+
+        # Skip hubs matching the origin or destination (one set built outside
+        # the loop rather than a fresh sequence per membership test)
+        endpoints = {origin, destination}
+        candidate_hubs = [hub for hub in hub_airports if hub not in endpoints]
+
+        # Prune hubs that can't possibly be worthwhile: the award-chart sum
+        # is a cost floor, so when it already misses the savings threshold
+        # there is no point paying two API round-trips to confirm
+        if direct_cost is not None:
+            threshold = direct_cost * (1 - WORTHWHILE_SAVINGS_PCT / 100)
+            candidate_hubs = [
+                hub for hub in candidate_hubs
+                if (_award_cost(origin, hub) + _award_cost(hub, destination)
+                    + LAYOVER_FEES) < threshold
+            ]
+
+        # Fan out both legs of every hub concurrently: 2N independent
+        # Amadeus round-trips collapse to roughly one RTT of wall-clock.
+        # Legs are deduplicated across this pass and the direct search by
+        # the client's process-wide TTL cache (keyed on O/D/date/max_offers),
+        # so no request-scoped leg cache is needed here.
+        queries = []
+        for hub in candidate_hubs:
+            queries.append((origin, hub, travel_date))
+            queries.append((hub, destination, travel_date))
+        leg_offers = self.amadeus_client.search_flights_many(queries, max_offers=1)
+
         layover_routes = []
-        
-        for hub in hub_airports:
-            # Skip if hub is the same as origin or destination
-            if hub in [origin, destination]:
-                continue
-            
-            # Search for real flights to hub
-            segment1_offers = self.amadeus_client.search_flights(
-                origin=origin,
-                destination=hub,
-                departure_date=travel_date,
-                max_offers=1
-            )
-            
-            # Search for real flights from hub to destination
-            segment2_offers = self.amadeus_client.search_flights(
-                origin=hub,
-                destination=destination,
-                departure_date=travel_date,
-                max_offers=1
-            )
-            
+
+        for i, hub in enumerate(candidate_hubs):
+            segment1_offers = leg_offers[2 * i]
+            segment2_offers = leg_offers[2 * i + 1]
+
             if segment1_offers and segment2_offers:
                 segment1 = segment1_offers[0]
                 segment2 = segment2_offers[0]
@@ -266,15 +295,15 @@ class RouteOptimizer:
                 
                 # Total cost is sum of both segments
                 total_miles = segment1_cost + segment2_cost
-                total_fees = 75.0  # Higher fees for layover routes
+                total_fees = LAYOVER_FEES
                 
                 # Calculate total duration
                 duration1 = self._parse_duration(segment1.duration)
                 duration2 = self._parse_duration(segment2.duration)
                 total_duration = duration1 + duration2 + 2.0  # Add 2 hours for layover
                 
-                # Combine segments
-                combined_segments = segment1.segments + segment2.segments
+                # Combine segments without an intermediate copy per operand
+                combined_segments = list(chain(segment1.segments, segment2.segments))
                 
                 layover_routes.append(FlightRoute(
                     origin=origin,
@@ -291,6 +320,46 @@ class RouteOptimizer:
         
         return layover_routes
     
+    def find_all_routes_parallel(self, origin: str, destination: str,
+                                 travel_date: date) -> Tuple[List[FlightRoute], List[FlightRoute]]:
+        """
+        Find direct and layover routes concurrently.
+
+        Both searches are independent, Amadeus-bound I/O, so running them in
+        a thread pool cuts wall-clock time to the slower of the two instead
+        of their sum.
+
+        Args:
+            origin: Origin airport code
+            destination: Destination airport code
+            travel_date: Date of travel
+
+        Returns:
+            Tuple of (direct_routes, layover_routes)
+        """
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            direct_future = executor.submit(self.find_direct_routes, origin, destination, travel_date)
+            layover_future = executor.submit(self.find_layover_routes, origin, destination, travel_date)
+            return direct_future.result(), layover_future.result()
+
+    async def find_optimal_routes_async(self, origin: str, destination: str,
+                                        travel_date: date, max_routes: int = 5) -> Dict[str, Any]:
+        """
+        Async variant of find_optimal_routes.
+
+        Direct and layover discovery run concurrently via asyncio.gather,
+        with the blocking Amadeus calls pushed to worker threads, then the
+        results feed the normal ranking path. Lets event-loop callers run
+        many city pairs in flight at once without blocking the loop.
+        """
+        direct_routes, layover_routes = await asyncio.gather(
+            asyncio.to_thread(self.find_direct_routes, origin, destination, travel_date),
+            asyncio.to_thread(self.find_layover_routes, origin, destination, travel_date),
+        )
+        return self.find_optimal_routes(origin, destination, travel_date, max_routes,
+                                        direct_routes=direct_routes,
+                                        layover_routes=layover_routes)
+
     def calculate_synthetic_savings(self, direct_cost: float, layover_cost: float) -> Dict[str, Any]:
         """
         Calculate potential savings from synthetic routing.
@@ -304,70 +373,92 @@ class RouteOptimizer:
         """
         savings = direct_cost - layover_cost
         savings_percentage = (savings / direct_cost) * 100 if direct_cost > 0 else 0
-        
+
         return {
             'direct_cost': direct_cost,
             'layover_cost': layover_cost,
             'savings': savings,
             'savings_percentage': savings_percentage,
-            'is_worthwhile': savings > 0 and savings_percentage > 10  # 10% threshold
+            'is_worthwhile': savings > 0 and savings_percentage > WORTHWHILE_SAVINGS_PCT
         }
     
-    def rank_routes_by_value(self, routes_list: List[FlightRoute]) -> List[Dict[str, Any]]:
+    def rank_routes_by_value(self, routes_list: List[FlightRoute],
+                             top_k: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Rank routes by value (lowest cost first).
-        
+
         Args:
             routes_list: List of FlightRoute objects
-            
+            top_k: Build analysis dicts only for the K best routes
+
         Returns:
             List of ranked routes with value analysis
         """
+        # Extract the scoring columns, run the fused kernel, and sort the
+        # indices on plain floats; analysis dicts are built in ranked order
+        total_costs = [route.total_cost for route in routes_list]
+        segment_counts = [len(route.segments) for route in routes_list]
+        final_scores = _score_routes(total_costs, segment_counts)
+
+        order = sorted(range(len(routes_list)), key=final_scores.__getitem__, reverse=True)
+
+        # Only the requested head ever gets an analysis dict
+        if top_k is not None:
+            order = order[:top_k]
+
         ranked_routes = []
-        
-        for route in routes_list:
-            # Calculate value metrics
-            value_analysis = {
+        for index in order:
+            route = routes_list[index]
+            final_score = final_scores[index]
+            # Recover the components from the kernel's score so the formula
+            # lives in _score_routes alone
+            complexity_penalty = segment_counts[index] * 0.1  # Penalty for more segments
+            ranked_routes.append({
                 'route': route,
-                'total_cost': route.total_cost,
-                'cost_per_mile': route.total_miles / route.duration_hours if route.duration_hours > 0 else 0,
-                'efficiency_score': 1000 / route.total_cost if route.total_cost > 0 else 0,  # Higher is better
-                'complexity_penalty': len(route.segments) * 0.1  # Penalty for more segments
-            }
-            
-            # Adjust efficiency score for complexity
-            value_analysis['final_score'] = value_analysis['efficiency_score'] - value_analysis['complexity_penalty']
-            
-            ranked_routes.append(value_analysis)
-        
-        # Sort by final score (highest first)
-        ranked_routes.sort(key=lambda x: x['final_score'], reverse=True)
-        
+                'total_cost': total_costs[index],
+                'cost_per_mile': (route.total_miles / route.duration_hours
+                                  if route.duration_hours > 0 else 0),
+                'efficiency_score': final_score + complexity_penalty,  # Higher is better
+                'complexity_penalty': complexity_penalty,
+                'final_score': final_score
+            })
+
         return ranked_routes
     
-    def find_optimal_routes(self, origin: str, destination: str, 
-                           travel_date: date, max_routes: int = 5) -> Dict[str, Any]:
+    def find_optimal_routes(self, origin: str, destination: str,
+                           travel_date: date, max_routes: int = 5,
+                           direct_routes: Optional[List[FlightRoute]] = None,
+                           layover_routes: Optional[List[FlightRoute]] = None) -> Dict[str, Any]:
         """
         Find the optimal routes combining direct and layover options using real Amadeus data.
-        
+
         Args:
             origin: Origin airport code
             destination: Destination airport code
             travel_date: Date of travel
             max_routes: Maximum number of routes to return
-            
+            direct_routes: Precomputed direct routes (fetched if omitted)
+            layover_routes: Precomputed layover routes (fetched if omitted)
+
         Returns:
             Dictionary with optimal routes and analysis
         """
-        print(f"🔍 Searching for flights from {origin} to {destination} on {travel_date}")
-        
-        # Find direct routes using Amadeus API
-        direct_routes = self.find_direct_routes(origin, destination, travel_date)
-        print(f"Found {len(direct_routes)} direct routes")
-        
-        # Find layover routes using Amadeus API
-        layover_routes = self.find_layover_routes(origin, destination, travel_date)
-        print(f"Found {len(layover_routes)} layover routes")
+        logger.info("Searching for flights from %s to %s on %s", origin, destination, travel_date)
+
+        # Reuse precomputed routes when the caller already fetched them,
+        # otherwise find direct and layover routes concurrently via Amadeus
+        if direct_routes is None and layover_routes is None:
+            direct_routes, layover_routes = self.find_all_routes_parallel(origin, destination, travel_date)
+        elif direct_routes is None:
+            direct_routes = self.find_direct_routes(origin, destination, travel_date)
+        elif layover_routes is None:
+            # Direct cost is already known, so unpromising hubs get pruned
+            # before any layover API call
+            best_direct_cost = direct_routes[0].total_cost if direct_routes else None
+            layover_routes = self.find_layover_routes(origin, destination, travel_date,
+                                                      direct_cost=best_direct_cost)
+        logger.info("Found %d direct routes", len(direct_routes))
+        logger.info("Found %d layover routes", len(layover_routes))
         
         # Combine all routes
         all_routes = direct_routes + layover_routes
@@ -380,23 +471,25 @@ class RouteOptimizer:
                 'message': 'No routes available for the specified criteria.'
             }
         
-        # Rank routes by value
-        ranked_routes = self.rank_routes_by_value(all_routes)
-        
-        # Limit to max_routes
-        top_routes = ranked_routes[:max_routes]
+        # Rank routes by value, materializing analysis only for the head
+        top_routes = self.rank_routes_by_value(all_routes, top_k=max_routes)
         
-        # Find savings opportunities
+        # Find savings opportunities: extract the cost column once, compare
+        # every layover against the fixed threshold in one pass, and build
+        # the full savings analysis only for the winners
         savings_opportunities = []
         if len(direct_routes) > 0 and len(layover_routes) > 0:
             direct_cost = direct_routes[0].total_cost
-            for layover_route in layover_routes:
-                savings = self.calculate_synthetic_savings(direct_cost, layover_route.total_cost)
-                if savings['is_worthwhile']:
-                    savings_opportunities.append({
-                        'layover_route': layover_route,
-                        'savings_analysis': savings
-                    })
+            threshold_cost = direct_cost * (1 - WORTHWHILE_SAVINGS_PCT / 100)
+            layover_costs = [route.total_cost for route in layover_routes]
+            savings_opportunities = [
+                {
+                    'layover_route': layover_routes[index],
+                    'savings_analysis': self.calculate_synthetic_savings(direct_cost, cost)
+                }
+                for index, cost in enumerate(layover_costs)
+                if cost < threshold_cost
+            ]
         
         return {
             'routes': top_routes,